@@ -1,13 +1,27 @@
+import csv
+
+import numpy as np
 import pandas as pd
 
-# Load your dataset
-df = pd.read_csv("Attendance Optimization.csv")   # or pd.read_excel(...)
+source_path = "Attendance Optimization.csv"
 
 # Desired size
 target_size = 60
 
-# Bootstrap sample (sampling with replacement)
-bootstrapped_df = df.sample(n=target_size, replace=True, random_state=42)
+# Count records without building a DataFrame (csv handles the multi-line quoted headers)
+with open(source_path, newline="") as f:
+    n_rows = sum(1 for _ in csv.reader(f)) - 1
+
+# Bootstrap sample (sampling with replacement) -- same draw as df.sample(n=60, replace=True, random_state=42)
+idx = np.random.RandomState(42).choice(n_rows, size=target_size, replace=True)
+keep = np.unique(idx)
+
+# Load your dataset, parsing only the rows that were drawn
+keep_set = set(keep.tolist())
+df = pd.read_csv(source_path, skiprows=lambda i: i > 0 and (i - 1) not in keep_set)
+
+# Restore draw order (and duplicates) by integer indexing into the unique rows
+bootstrapped_df = df.iloc[np.searchsorted(keep, idx)]
 
 # Save the new bootstrapped dataset
 bootstrapped_df.to_csv("Attendance_Optimization_bootstrapped_60.csv", index=False)
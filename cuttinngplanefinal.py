@@ -1,6 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from scipy.optimize import linprog
+from scipy.sparse import coo_matrix, csr_matrix
+import numpy as np
+import functools
 import math
 
 # -------------------------
@@ -24,6 +27,7 @@ PROFESSORS = [
     {"id": 15, "name": "Prof. Manish Kumar", "pv": 7.7, "le": 7.1, "se": 7.4, "ar": 8.1},
     {"id": 16, "name": "Prof. Sanjeewani Sehgal", "pv": 7.5, "le": 6.9, "se": 7.2, "ar": 7.7},
 ]
+PROFESSOR_BY_ID = {p["id"]: p for p in PROFESSORS}
 
 DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
 
@@ -35,6 +39,7 @@ TIME_SLOTS = [
     {"id": 5, "time": "14:00-15:00", "block": "afternoon"},
     {"id": 6, "time": "15:00-16:00", "block": "afternoon"},
 ]
+BLOCK_BY_SLOTID = {s["id"]: s["block"] for s in TIME_SLOTS}
 
 PRIORITY_LEVELS = ["Very High", "High", "Medium", "Low", "Avoid"]
 PRIORITY_MULTIPLIER = {
@@ -45,53 +50,84 @@ PRIORITY_MULTIPLIER = {
     "Avoid": 0.80
 }
 
+# APS weights: w1..w4 professor factors (pv, le, se, ar), w5 time block, w6 holiday skip,
+# w7/w8 travel time and time commitment penalties
+W_PROF = np.array([0.1476, 0.1456, 0.1370, 0.1356])
+W_TB, W_HS, W_TRAVEL, W_COMMIT = 0.1203, 0.1225, 0.0935, 0.0979
+TIME_BLOCK_RATINGS = {"morning": 7.5, "midday": 7.0, "afternoon": 6.5}
+HS_BASELINE = 5.0
+
+# Professor factor table, row i = PROFESSORS[i]
+PROF_TABLE = np.array([[p["pv"], p["le"], p["se"], p["ar"]] for p in PROFESSORS])
+PROF_INDEX = {p["id"]: i for i, p in enumerate(PROFESSORS)}
+
+# Per-class numeric record used to build the LP
+CLASS_DTYPE = np.dtype([("instructorId", "i2"), ("aps", "f8")])
+
 # -------------------------
 # Utilities
 # -------------------------
 def find_professor(pid):
-    return next((p for p in PROFESSORS if p["id"] == pid), None)
+    return PROFESSOR_BY_ID.get(pid)
 
 
-def calculate_aps(instructor_id, time_block, student_profile, priorities):
-    prof = find_professor(instructor_id)
-    if prof is None:
-        return 0.0
-    timeBlockRatings = {"morning": 7.5, "midday": 7.0, "afternoon": 6.5}
-    weights = {
-        "w1": 0.1476, "w2": 0.1456, "w3": 0.1370, "w4": 0.1356,
-        "w5": 0.1203, "w6": 0.1225, "w7": 0.0935, "w8": 0.0979
-    }
-    TB = timeBlockRatings.get(time_block, 7.0)
-    HS = 5.0
+@functools.lru_cache(maxsize=128)
+def _aps(instructor_ids, time_blocks, travel, commit, levels):
+    prof_idx = np.array([PROF_INDEX.get(iid, -1) for iid in instructor_ids], dtype=np.intp)
+    tb = np.array([TIME_BLOCK_RATINGS.get(block, 7.0) for block in time_blocks])
+    mult = np.array([PRIORITY_MULTIPLIER.get(level, 1.10) for level in levels])
+    pv, le, se, ar = PROF_TABLE[prof_idx].T
+    # Same term order as the original scalar formula
     aps_base = (
-        weights["w1"] * prof["pv"] +
-        weights["w2"] * prof["le"] +
-        weights["w3"] * prof["se"] +
-        weights["w4"] * prof["ar"] +
-        weights["w5"] * TB +
-        weights["w6"] * HS -
-        weights["w7"] * student_profile.get("travelTime", 0.0) -
-        weights["w8"] * student_profile.get("timeCommitment", 0.0)
+        W_PROF[0] * pv +
+        W_PROF[1] * le +
+        W_PROF[2] * se +
+        W_PROF[3] * ar +
+        W_TB * tb +
+        W_HS * HS_BASELINE -
+        W_TRAVEL * travel -
+        W_COMMIT * commit
     )
-    level = priorities.get(instructor_id, "Medium")
-    mult = PRIORITY_MULTIPLIER.get(level, 1.10)
-    aps_final = aps_base * mult
-    return round(aps_final, 3)
+    # Python round() per value, as the scalar formula did: np.round scales and rints,
+    # which settles near-ties differently and would shift the LP coefficients
+    raw = np.where(prof_idx >= 0, aps_base * mult, 0.0)
+    aps_final = np.array([round(a, 3) for a in raw.tolist()])
+    aps_final.flags.writeable = False  # shared between cache hits
+    return aps_final
+
+
+def calculate_aps(instructor_ids, time_blocks, student_profile, priorities):
+    """
+    APS for a batch of classes in one vectorized pass.
+    Unknown instructors score 0.0, same as before. Results are memoized on the
+    full (classes, profile, priority levels) key, so re-optimizing an unchanged
+    setup skips the APS math entirely.
+    """
+    instructor_ids = tuple(instructor_ids)
+    levels = tuple(priorities.get(iid, "Medium") for iid in instructor_ids)
+    return _aps(instructor_ids, tuple(time_blocks),
+                float(student_profile.get("travelTime", 0.0)),
+                float(student_profile.get("timeCommitment", 0.0)),
+                levels)
 
 
 # -------------------------
-# Integer solver using LP relaxations + branching
+# Integer solver (HiGHS branch-and-cut via linprog integrality)
 # -------------------------
 def optimize_attendance_integer(timetable, student_profile, priorities, desired_attendance_percent):
     # Build class list and APS
-    class_list = []
-    for key, cls in timetable.items():
-        slot = next((s for s in TIME_SLOTS if s["id"] == cls["slotId"]), None)
-        aps = calculate_aps(cls["instructorId"], slot["block"] if slot else "midday", student_profile, priorities)
-        class_list.append({**cls, "aps": aps, "key": key})
-    n = len(class_list)
+    n = len(timetable)
     if n == 0:
         return None
+    # Numeric fields live in one structured array; class_list keeps the full records for output
+    classes = np.empty(n, dtype=CLASS_DTYPE)
+    blocks = []
+    for i, cls in enumerate(timetable.values()):
+        blocks.append(BLOCK_BY_SLOTID.get(cls["slotId"], "midday"))
+        classes[i] = (cls["instructorId"], 0.0)
+    classes["aps"] = calculate_aps(classes["instructorId"].tolist(), blocks, student_profile, priorities)
+    class_list = [{**cls, "aps": float(aps), "key": key}
+                  for (key, cls), aps in zip(timetable.items(), classes["aps"])]
 
     total_classes_per_week = n
     # Desired percentage normalized and required integer count (ceil)
@@ -104,120 +140,41 @@ def optimize_attendance_integer(timetable, student_profile, priorities, desired_
     required_classes_semester = required_per_week * weeks
 
     # Objective: maximize sum APS * x -> minimize -APS * x
-    c = [-cls["aps"] for cls in class_list]
-
-    # Instructor constraints: for instructors with >=2 classes, sum >= 2 -> expressed as -sum <= -2
-    instructor_classes = {}
-    for i, cls in enumerate(class_list):
-        iid = cls["instructorId"]
-        instructor_classes.setdefault(iid, []).append(i)
-    A_ub_base = []
-    b_ub_base = []
-    for iid, indices in instructor_classes.items():
-        if len(indices) >= 2:
-            row = [0.0] * n
-            for idx in indices:
-                row[idx] = -1.0
-            A_ub_base.append(row)
-            b_ub_base.append(-2.0)
+    c = -classes["aps"]
+
+    # Instructor constraints: for instructors with >=2 classes, sum >= 2 -> expressed as -sum <= -2.
+    # Group class indices by instructor with one stable sort instead of a dict of lists.
+    iids = classes["instructorId"]
+    order = np.argsort(iids, kind="stable")
+    _, starts = np.unique(iids[order], return_index=True)
+    groups = [g for g in np.split(order, starts[1:]) if len(g) >= 2]
+    # Each cover row only touches that instructor's classes, so build it sparse
+    n_ub = len(groups)
+    A_ub = None
+    b_ub = None
+    if n_ub:
+        rows = np.repeat(np.arange(n_ub), [len(g) for g in groups])
+        cols = np.concatenate(groups)
+        A_ub = coo_matrix((-np.ones(len(cols)), (rows, cols)), shape=(n_ub, n)).tocsr()
+        b_ub = np.full(n_ub, -2.0)
 
     # Sum equality constraint: sum x_i == required_per_week
-    A_eq_base = [[1.0] * n]
-    b_eq_base = [float(required_per_week)]
-
-    bounds = [(0.0, 1.0) for _ in range(n)]
-
-    # Helper: solve LP relaxation with additional cuts/constraints passed in
-    def solve_lp(add_A_ub, add_b_ub, add_A_eq, add_b_eq):
-        A_ub = None
-        b_ub = None
-        if A_ub_base or add_A_ub:
-            A_ub = []
-            b_ub = []
-            if A_ub_base:
-                A_ub.extend(A_ub_base)
-                b_ub.extend(b_ub_base)
-            if add_A_ub:
-                A_ub.extend(add_A_ub)
-                b_ub.extend(add_b_ub)
-        A_eq = None
-        b_eq = None
-        if A_eq_base or add_A_eq:
-            A_eq = []
-            b_eq = []
-            if A_eq_base:
-                A_eq.extend(A_eq_base)
-                b_eq.extend(b_eq_base)
-            if add_A_eq:
-                A_eq.extend(add_A_eq)
-                b_eq.extend(add_b_eq)
-        result = linprog(c=c, A_ub=A_ub if A_ub else None, b_ub=b_ub if b_ub else None,
-                         A_eq=A_eq if A_eq else None, b_eq=b_eq if b_eq else None,
-                         bounds=bounds, method='highs')
-        return result
-
-    # Best integer solution found so far (store objective and x)
-    best_solution = {"obj": -1e99, "x": None}
-
-    # Branch-and-bound recursive search
-    def branch_and_bound(add_A_ub=None, add_b_ub=None, add_A_eq=None, add_b_eq=None, depth=0):
-        nonlocal best_solution
-        result = solve_lp(add_A_ub, add_b_ub, add_A_eq, add_b_eq)
-        if result is None or not result.success:
-            return  # infeasible or failed
-        x = result.x
-        obj_val = -result.fun  # because we minimized -APS
-        # If objective <= best known, prune
-        if obj_val <= best_solution["obj"] + 1e-6:
-            return
-        # Check integrality
-        fractional_indices = [i for i, xi in enumerate(x) if abs(xi - round(xi)) > 1e-6]
-        if not fractional_indices:
-            # integer solution found
-            if obj_val > best_solution["obj"]:
-                best_solution["obj"] = obj_val
-                best_solution["x"] = [int(round(xi)) for xi in x]
-            return
-        # Heuristic: try to add a simple cover cut if many variables fractional
-        frac_vars = [i for i, xi in enumerate(x) if xi > 1e-8 and xi < 1 - 1e-8]
-        if len(frac_vars) >= 2:
-            s = sum(x[i] for i in frac_vars)
-            rhs = math.floor(s)
-            if rhs < len(frac_vars):
-                row = [0.0] * n
-                for i in frac_vars:
-                    row[i] = 1.0
-                new_A_ub = (add_A_ub[:] if add_A_ub else []) + [row]
-                new_b_ub = (add_b_ub[:] if add_b_ub else []) + [float(rhs)]
-                res_with_cut = solve_lp(new_A_ub, new_b_ub, add_A_eq, add_b_eq)
-                if res_with_cut is not None and res_with_cut.success:
-                    branch_and_bound(new_A_ub, new_b_ub, add_A_eq, add_b_eq, depth + 1)
-        # If no useful cut or didn't finish, branch on the most fractional variable
-        frac_scores = [(i, abs(x[i] - 0.5)) for i in fractional_indices]
-        frac_scores.sort(key=lambda t: t[1])  # ascending -> closest to 0.5 first
-        branch_var = frac_scores[0][0]
-        # Branch x_branch = 0
-        row0 = [0.0] * n
-        row0[branch_var] = 1.0
-        new_A_ub0 = (add_A_ub[:] if add_A_ub else []) + [row0]
-        new_b_ub0 = (add_b_ub[:] if add_b_ub else []) + [0.0]  # x_branch <= 0
-        branch_and_bound(new_A_ub0, new_b_ub0, add_A_eq, add_b_eq, depth + 1)
-        # Branch x_branch = 1 -> equality x_branch == 1
-        row1 = [0.0] * n
-        row1[branch_var] = 1.0
-        new_A_eq1 = (add_A_eq[:] if add_A_eq else []) + [row1]
-        new_b_eq1 = (add_b_eq[:] if add_b_eq else []) + [1.0]  # x_branch == 1
-        branch_and_bound(add_A_ub, add_b_ub, new_A_eq1, new_b_eq1, depth + 1)
-
-    # run branch-and-bound
-    branch_and_bound()
-
-    if best_solution["x"] is None:
+    A_eq = csr_matrix(np.ones((1, n)))
+    b_eq = np.array([float(required_per_week)])
+
+    bounds = (0.0, 1.0)
+
+    # Binary attendance: let HiGHS run its own branch-and-cut on the 0/1 program
+    result = linprog(c=c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds,
+                     integrality=np.ones(n, dtype=np.int8), method='highs')
+    if not result.success:
         return None
 
+    x_int = [int(round(xi)) for xi in result.x]
+
     # Build output structure (0/1 integer attendance)
     attendance_selection = {}
-    for i, val in enumerate(best_solution["x"]):
+    for i, val in enumerate(x_int):
         cls = class_list[i]
         key = f"{cls['day']}-{cls['slotId']}"
         attendance_selection[key] = {
@@ -256,13 +213,15 @@ def optimize_attendance_integer(timetable, student_profile, priorities, desired_
         "totalValue": round(total_value, 3),
         "avgValue": round(avg_value, 3),
         "instructorStats": instructor_stats,
-        "optimalObj": best_solution["obj"]
+        "optimalObj": -result.fun
     }
 
 
 # -------------------------
 # GUI
 # -------------------------
+CELL_INFO_FONT = ("TkDefaultFont", 8, "bold")
+
 class AttendanceApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -275,7 +234,11 @@ class AttendanceApp(tk.Tk):
         self.priorities = {p["id"]: "Medium" for p in PROFESSORS}
         self.desired_attendance_percent = tk.DoubleVar(value=75.0)
         self.optimized = None
+        # build the whole window hidden so the grid is laid out once on show
+        self.withdraw()
         self._build_ui()
+        self.update_idletasks()
+        self.deiconify()
 
     def _build_ui(self):
         top = ttk.Frame(self)
@@ -368,7 +331,7 @@ class AttendanceApp(tk.Tk):
                 cell = ttk.Frame(self.table_frame, relief=tk.GROOVE, borderwidth=1, width=220, height=42)
                 cell.grid_propagate(False)
                 cell.grid(row=r, column=c, sticky="nsew", padx=2, pady=2)
-                lbl = ttk.Label(cell, text="(empty)", anchor=tk.CENTER)
+                lbl = ttk.Label(cell, text="(empty)", anchor=tk.CENTER, justify=tk.CENTER)
                 lbl.pack(expand=True, fill=tk.BOTH)
                 key = f"{day}-{slot['id']}"
                 self.cell_widgets[key] = (cell, lbl)
@@ -415,24 +378,14 @@ class AttendanceApp(tk.Tk):
                 self._update_total_label()
 
     def _update_cell_ui(self, key):
-        cell, _ = self.cell_widgets[key]
-        for widget in cell.winfo_children():
-            widget.destroy()
+        _, lbl = self.cell_widgets[key]
         if key in self.timetable:
             cls = self.timetable[key]
             prof = find_professor(cls["instructorId"])
             text = f"{cls['subject']}\n{prof['name'] if prof else f'Instructor #{cls['instructorId']}'}"
-            lbl2 = ttk.Label(cell, text=text, anchor=tk.CENTER, justify=tk.CENTER)
-            lbl2.pack(expand=True, fill=tk.BOTH)
-            lbl2.bind("<Button-1>", lambda e, k=key: self._cell_clicked(k))
-            lbl2.configure(background="#e8f4ff")
-            cell.configure(width=220, height=42)
+            lbl.configure(text=text, background="#e8f4ff")
         else:
-            lbl2 = ttk.Label(cell, text="(empty)", anchor=tk.CENTER)
-            lbl2.pack(expand=True, fill=tk.BOTH)
-            lbl2.bind("<Button-1>", lambda e, k=key: self._cell_clicked(k))
-            lbl2.configure(background="#ffffff")
-            cell.configure(width=220, height=42)
+            lbl.configure(text="(empty)", background="#ffffff")
 
     def _update_total_label(self):
         total = len(self.timetable)
@@ -510,6 +463,7 @@ class AttendanceApp(tk.Tk):
 
     def _show_optimization_result(self, res):
         win = tk.Toplevel(self)
+        win.withdraw()
         win.title("Optimization Results - Integer Attendance")
         win.geometry("1000x700")
         top_frame = ttk.Frame(win)
@@ -556,7 +510,7 @@ class AttendanceApp(tk.Tk):
                                        bg=bg_color, fg=fg_color)
                         lbl.pack(expand=True, fill=tk.BOTH)
                         info_lbl = tk.Label(frame, text=f"Attend: {'YES' if sel==1 else 'NO'} (APS: {aps})",
-                                            font=("TkDefaultFont", 8, "bold"),
+                                            font=CELL_INFO_FONT,
                                             bg=bg_color, fg=fg_color)
                         info_lbl.pack()
                     else:
@@ -589,6 +543,8 @@ class AttendanceApp(tk.Tk):
         ttk.Label(win, text="Note: final timetable displays Instructor #ID only (Option A).",
                   font=("TkDefaultFont", 9, "italic")).pack(pady=4)
         ttk.Button(win, text="Close", command=win.destroy).pack(pady=6)
+        win.update_idletasks()
+        win.deiconify()
 
 
 if __name__ == "__main__":
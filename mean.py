@@ -1,17 +1,56 @@
+import hashlib
+import inspect
+import os
+import re
+import sys
+from collections import defaultdict
+
 import pandas as pd
 import numpy as np
+import matplotlib
+
+# With stdout redirected, the bar, heatmap and radar PNGs are the only output
+# wanted, so render off-screen with Agg and skip plt.show()
+INTERACTIVE = sys.stdout.isatty()
+if not INTERACTIVE:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import seaborn as sns
+from PIL import Image
+
+# --fast-heatmap writes the heatmap as a bare colour raster instead of the annotated seaborn plot
+FAST_HEATMAP = '--fast-heatmap' in sys.argv[1:]
+
+# The survey CSV is wide (a column per professor and factor question); pyarrow
+# parses it on several threads when installed, else pandas' C parser is used
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# Bottleneck's nan-aware reductions are used for the summary statistics when
+# installed; NumPy provides functions with the same names otherwise
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = np
+
+# Numba, when installed, compiles the column reduction into a parallel native loop
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 # Load data
 file_path = '/Users/debasmibasu/Documents/maths - lpp/Attendance_Optimization_bootstrapped_60.csv'
-df = pd.read_csv(file_path)
 
-print("="*80)
-print("PROFESSOR-SPECIFIC FACTOR ANALYSIS")
-print("="*80)
-print(f"Data loaded successfully! Shape: {df.shape}")
-print(f"Number of responses: {len(df)}\n")
+# Coerced professor/factor columns are cached here until the CSV, the column
+# classification or the coercion changes: the matrix as a memory-mappable .npy,
+# its column names and source/config stamp in the .npz
+cache_file = 'professor_factor_cache.npz'
+cache_matrix_file = 'professor_factor_cache.npy'
 
 # Define the 16 professors
 professors = [
@@ -47,72 +86,225 @@ factor_types = {
 }
 
 
-def calculate_professor_means():
+# Keyword identifying each of the 6 factors in the survey column headers
+# (order here is the column order of the results table)
+FACTOR_KEYWORDS = {
+    'Perceived_Value': 'Perceived value',
+    'Liking_Engagement': 'Liking & Engagement',
+    'Study_Efficiency': 'Study Time Efficiency',
+    'Attendance_Risk': 'Attendance Risk',
+    'Time_Block_Preference': 'Time Block',
+    'Holiday_Skip_Likelihood': 'Holiday Skip'
+}
+
+PROFESSOR_PATTERN = re.compile('|'.join(re.escape(p) for p in professors))
+FACTOR_PATTERN = re.compile('|'.join(re.escape(k) for k in FACTOR_KEYWORDS.values()))
+FACTOR_BY_KEYWORD = {keyword: factor for factor, keyword in FACTOR_KEYWORDS.items()}
+
+
+def build_column_index(columns):
+    """
+    Classify every survey column by professor and factor in a single pass
+    
+    Returns:
+    index: dict mapping (professor, factor) -> list of matching columns, in file order
+    """
+    
+    index = defaultdict(list)
+    
+    for col in columns:
+        prof_match = PROFESSOR_PATTERN.search(col)
+        factor_match = FACTOR_PATTERN.search(col)
+        if prof_match and factor_match:
+            index[(prof_match.group(0), FACTOR_BY_KEYWORD[factor_match.group(0)])].append(col)
+    
+    return index
+
+
+def cache_config_hash():
+    """
+    Hash of the professor list, factor keywords and the source of build_column_index,
+    column_codes and factor_matrix, so a cache written under a different column
+    classification or coercion is never reused
+    """
+    config = repr((professors, FACTOR_KEYWORDS))
+    source = ''.join(inspect.getsource(f) for f in (build_column_index, column_codes, factor_matrix))
+    return hashlib.sha256((config + source).encode()).hexdigest()
+
+
+PROFESSOR_CODE = {p: i for i, p in enumerate(professors)}
+FACTOR_CODE = {f: j for j, f in enumerate(FACTOR_KEYWORDS)}
+TIME_BLOCK_CODE = FACTOR_CODE['Time_Block_Preference']
+
+
+def column_codes(col_index):
+    """
+    Encode the professor and factor of every column in a build_column_index result
+    as small integer codes, without classifying the columns again
+    
+    Returns:
+    prof_code, factor_code: int8 arrays aligned with the index's columns, flattened in order
+    """
+    
+    sizes = [len(cols) for cols in col_index.values()]
+    prof_code = np.repeat(np.array([PROFESSOR_CODE[p] for p, _ in col_index], dtype=np.int8), sizes)
+    factor_code = np.repeat(np.array([FACTOR_CODE[f] for _, f in col_index], dtype=np.int8), sizes)
+    
+    return prof_code, factor_code
+
+
+def factor_matrix(df, columns):
+    """
+    Coerce the given survey columns into one column-major float matrix, NaN where a
+    response is missing or not a number
+    """
+    
+    # Fill one buffer directly; only non-numeric columns go through pd.to_numeric
+    numeric = np.empty((len(df), len(columns)), dtype=np.float64, order='F')
+    getcol = df.__getitem__
+    is_numeric_dtype = pd.api.types.is_numeric_dtype
+    for j, col in enumerate(columns):
+        values = getcol(col)
+        if not is_numeric_dtype(values):
+            values = pd.to_numeric(values, errors='coerce')
+        numeric[:, j] = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return numeric
+
+
+def load_factor_matrix(path, cache_path=cache_file, matrix_path=cache_matrix_file):
+    """
+    Load the professor/factor columns as a float matrix, reusing the on-disk cache
+    while the source CSV, the column classification and the coercion are unchanged
+    
+    Returns:
+    numeric: (responses x columns) float matrix, NaN where a response is missing
+    prof_code, factor_code: column_codes of the matrix columns
+    shape: shape of the full survey table
+    """
+    
+    mtime = os.path.getmtime(path)
+    config_hash = cache_config_hash()
+    if os.path.exists(cache_path) and os.path.exists(matrix_path):
+        with np.load(cache_path) as cache:
+            if (str(cache['source']) == path and float(cache['source_mtime']) == mtime
+                    and 'config_hash' in cache and str(cache['config_hash']) == config_hash):
+                numeric = np.load(matrix_path, mmap_mode='r')
+                columns = cache['columns'].tolist()
+                shape = tuple(cache['shape'].tolist())
+                if numeric.shape == (shape[0], len(columns)):
+                    return numeric, cache['prof_code'], cache['factor_code'], shape
+    
+    df = pd.read_csv(path, engine=CSV_ENGINE)
+    col_index = build_column_index(df.columns)
+    columns = [col for cols in col_index.values() for col in cols]
+    prof_code, factor_code = column_codes(col_index)
+    numeric = factor_matrix(df, columns)
+    
+    # Drop the old stamp, then write the matrix before the new stamp, so a readable
+    # stamp (and its config hash) always refers to the matrix file written with it
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
+    np.save(matrix_path, numeric)
+    np.savez(cache_path, columns=np.array(columns), prof_code=prof_code, factor_code=factor_code,
+             shape=np.array(df.shape), source=path, source_mtime=mtime, config_hash=config_hash)
+    return numeric, prof_code, factor_code, df.shape
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def column_sums_counts(numeric):
+        """
+        Per-column sum and count of the non-missing entries of a float matrix
+        """
+        n_rows, n_cols = numeric.shape
+        sums = np.zeros(n_cols)
+        counts = np.zeros(n_cols, dtype=np.int64)
+        for j in prange(n_cols):
+            total = 0.0
+            n = 0
+            for i in range(n_rows):
+                v = numeric[i, j]
+                if v == v:
+                    total += v
+                    n += 1
+            sums[j] = total
+            counts[j] = n
+        return sums, counts
+else:
+    def column_sums_counts(numeric):
+        """
+        Per-column sum and count of the non-missing entries of a float matrix
+        """
+        valid = ~np.isnan(numeric)
+        return np.where(valid, numeric, 0.0).sum(axis=0), valid.sum(axis=0)
+
+
+def calculate_professor_means(numeric, prof_code, factor_code):
     """
     Calculate mean scores for each of the 6 factors for all 16 professors
     
+    Parameters:
+    numeric: float matrix from load_factor_matrix
+    prof_code, factor_code: column codes of numeric from load_factor_matrix
+    
     Returns:
     results_df: DataFrame with professors as rows and factors as columns
     """
     
-    results = []
+    n_factors = len(FACTOR_KEYWORDS)
+    group = prof_code.astype(np.intp) * n_factors + factor_code
     
-    for professor in professors:
-        prof_data = {}
-        prof_data['Professor'] = professor
-        
-        # Factor 1: Perceived Value/Learning
-        perceived_cols = [col for col in df.columns if 'Perceived value' in col and professor in col]
-        if perceived_cols:
-            prof_data['Perceived_Value'] = df[perceived_cols[0]].apply(pd.to_numeric, errors='coerce').mean()
-        else:
-            prof_data['Perceived_Value'] = np.nan
-        
-        # Factor 2: Liking & Engagement
-        engagement_cols = [col for col in df.columns if 'Liking & Engagement' in col and professor in col]
-        if engagement_cols:
-            prof_data['Liking_Engagement'] = df[engagement_cols[0]].apply(pd.to_numeric, errors='coerce').mean()
-        else:
-            prof_data['Liking_Engagement'] = np.nan
-        
-        # Factor 3: Study Time Efficiency
-        efficiency_cols = [col for col in df.columns if 'Study Time Efficiency' in col and professor in col]
-        if efficiency_cols:
-            prof_data['Study_Efficiency'] = df[efficiency_cols[0]].apply(pd.to_numeric, errors='coerce').mean()
-        else:
-            prof_data['Study_Efficiency'] = np.nan
-        
-        # Factor 4: Attendance Risk
-        risk_cols = [col for col in df.columns if 'Attendance Risk' in col and professor in col]
-        if risk_cols:
-            prof_data['Attendance_Risk'] = df[risk_cols[0]].apply(pd.to_numeric, errors='coerce').mean()
-        else:
-            prof_data['Attendance_Risk'] = np.nan
-        
-        # Factor 5: Time Block Preference (average across all time blocks)
-        time_cols = [col for col in df.columns if 'Time Block' in col and professor in col]
-        if time_cols:
-            time_values = []
-            for col in time_cols:
-                vals = df[col].apply(pd.to_numeric, errors='coerce')
-                time_values.extend(vals.dropna().tolist())
-            prof_data['Time_Block_Preference'] = np.mean(time_values) if time_values else np.nan
-        else:
-            prof_data['Time_Block_Preference'] = np.nan
-        
-        # Factor 6: Holiday Skip Likelihood
-        holiday_cols = [col for col in df.columns if 'Holiday Skip' in col and professor in col]
-        if holiday_cols:
-            prof_data['Holiday_Skip_Likelihood'] = df[holiday_cols[0]].apply(pd.to_numeric, errors='coerce').mean()
-        else:
-            prof_data['Holiday_Skip_Likelihood'] = np.nan
-        
-        results.append(prof_data)
+    # Per-column sums and non-missing counts in a single pass over the matrix
+    col_sums, col_counts = column_sums_counts(numeric)
+    
+    # Only the first matching column counts for a factor; Time Block averages across all blocks
+    _, first = np.unique(group, return_index=True)
+    keep = np.zeros(len(group), dtype=bool)
+    keep[first] = True
+    keep[factor_code == TIME_BLOCK_CODE] = True
+    
+    # Pool sums and counts per (professor, factor) cell
+    n_cells = len(professors) * n_factors
+    sums = np.bincount(group[keep], weights=col_sums[keep], minlength=n_cells)
+    counts = np.bincount(group[keep], weights=col_counts[keep], minlength=n_cells)
+    means = np.full(n_cells, np.nan)
+    np.divide(sums, counts, out=means, where=counts > 0)
+    means = means.reshape(len(professors), n_factors)
+    factor_names = list(FACTOR_KEYWORDS)
     
-    results_df = pd.DataFrame(results)
+    # Professor labels are dictionary-encoded: one small integer code per row
+    professor_index = pd.CategoricalIndex(professors, categories=professors, name='Professor')
+    results_df = pd.DataFrame(means, index=professor_index, columns=factor_names).reset_index()
     return results_df
 
 
+def reset_figure(fig, figsize):
+    """
+    Carry the heatmap's figure on to the bar grid and then the radar chart,
+    cleared and resized in place; a new one is made when there is none yet
+    (--fast-heatmap draws no figure) or plt.show() already closed it
+    """
+    
+    if fig is None or not plt.fignum_exists(fig.number):
+        return plt.figure(figsize=figsize)
+    fig.clf()
+    fig.set_size_inches(*figsize)
+    return fig
+
+
+def save_fast_heatmap(plot_data, path, cell_size=(80, 40)):
+    """
+    Write the professor x factor heatmap as an unlabelled raster: scores are mapped
+    through the RdYlGn colormap (1-10) and each cell is upscaled to cell_size pixels
+    """
+    
+    scores = plot_data.to_numpy(dtype=np.float64)
+    rgba = matplotlib.colormaps['RdYlGn'](np.clip((scores - 1) / 9, 0, 1), bytes=True)
+    rgba[np.isnan(scores)] = (200, 200, 200, 255)
+    size = (scores.shape[1] * cell_size[0], scores.shape[0] * cell_size[1])
+    Image.fromarray(rgba).resize(size, Image.Resampling.NEAREST).save(path)
+
+
 def plot_professor_comparison(results_df):
     """
     Create visualizations comparing professors across all factors
@@ -122,30 +314,35 @@ def plot_professor_comparison(results_df):
     plot_data = results_df.set_index('Professor')
     
     # 1. Heatmap of all professors and factors
-    plt.figure(figsize=(14, 10))
-    sns.heatmap(plot_data, 
-                annot=True, 
-                fmt='.2f', 
-                cmap='RdYlGn',
-                center=5,
-                vmin=1, 
-                vmax=10,
-                linewidths=0.5,
-                cbar_kws={'label': 'Score (1-10)'})
-    plt.title('Professor Performance Across 6 Key Factors\n(Higher scores = Better)', 
-              fontsize=16, fontweight='bold', pad=20)
-    plt.xlabel('Factors', fontsize=12, fontweight='bold')
-    plt.ylabel('Professors', fontsize=12, fontweight='bold')
-    plt.xticks(rotation=45, ha='right')
-    plt.yticks(rotation=0)
-    plt.tight_layout()
-    plt.savefig('professor_factor_heatmap.png', dpi=300, bbox_inches='tight')
+    fig = None
+    if FAST_HEATMAP:
+        save_fast_heatmap(plot_data, 'professor_factor_heatmap.png')
+    else:
+        fig = plt.figure(figsize=(14, 10))
+        sns.heatmap(plot_data, 
+                    annot=True, 
+                    fmt='.2f', 
+                    cmap='RdYlGn',
+                    center=5,
+                    vmin=1, 
+                    vmax=10,
+                    linewidths=0.5,
+                    cbar_kws={'label': 'Score (1-10)'})
+        plt.title('Professor Performance Across 6 Key Factors\n(Higher scores = Better)', 
+                  fontsize=16, fontweight='bold', pad=20)
+        plt.xlabel('Factors', fontsize=12, fontweight='bold')
+        plt.ylabel('Professors', fontsize=12, fontweight='bold')
+        plt.xticks(rotation=45, ha='right')
+        plt.yticks(rotation=0)
+        plt.tight_layout()
+        plt.savefig('professor_factor_heatmap.png', dpi=150, bbox_inches='tight')
+        if INTERACTIVE:
+            plt.show()
     print("Heatmap saved to 'professor_factor_heatmap.png'")
-    plt.show()
     
     # 2. Bar chart for each factor
-    fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-    axes = axes.ravel()
+    fig = reset_figure(fig, (18, 12))
+    axes = fig.subplots(2, 3).ravel()
     
     factors = plot_data.columns
     colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8', '#F7DC6F']
@@ -163,37 +360,40 @@ def plot_professor_comparison(results_df):
         ax.set_xlim(0, 10)
         
         # Add value labels
-        for i, (bar, val) in enumerate(zip(bars, data_sorted.values)):
-            if not np.isnan(val):
-                ax.text(val + 0.1, i, f'{val:.2f}', va='center', fontsize=8)
+        ax.bar_label(bars, labels=['' if np.isnan(val) else f'{val:.2f}' for val in data_sorted.values],
+                     padding=3, fontsize=8)
     
     plt.tight_layout()
-    plt.savefig('professor_factor_bars.png', dpi=300, bbox_inches='tight')
+    plt.savefig('professor_factor_bars.png', dpi=150, bbox_inches='tight')
     print("Bar charts saved to 'professor_factor_bars.png'")
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
     
     # 3. Radar chart for top 5 professors
-    top_5_profs = results_df.set_index('Professor').mean(axis=1).nlargest(5).index
+    # Row-major copy of the scores so per-professor reductions and lookups are contiguous
+    scores = np.ascontiguousarray(plot_data.to_numpy(dtype=np.float64))
+    top_5_rows = np.argsort(-np.nanmean(scores, axis=1), kind='stable')[:5]
     
-    fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
+    fig = reset_figure(fig, (10, 10))
+    ax = fig.add_subplot(projection='polar')
     
     # Number of variables
     categories = list(plot_data.columns)
     N = len(categories)
     
-    # Compute angle for each axis
-    angles = [n / float(N) * 2 * np.pi for n in range(N)]
-    angles += angles[:1]
+    # Compute angle for each axis, closing the polygon back at the first one
+    angles = np.linspace(0, 2 * np.pi, N, endpoint=False)
+    angles_closed = np.concatenate([angles, angles[:1]])
     
     # Plot data
-    for prof in top_5_profs:
-        values = plot_data.loc[prof].values.tolist()
-        values += values[:1]
-        ax.plot(angles, values, 'o-', linewidth=2, label=prof)
-        ax.fill(angles, values, alpha=0.15)
+    for row in top_5_rows:
+        prof = plot_data.index[row]
+        values = np.concatenate([scores[row], scores[row, :1]])
+        ax.plot(angles_closed, values, 'o-', linewidth=2, label=prof)
+        ax.fill(angles_closed, values, alpha=0.15)
     
     # Fix axis to go in the right order
-    ax.set_xticks(angles[:-1])
+    ax.set_xticks(angles)
     ax.set_xticklabels([cat.replace('_', '\n') for cat in categories], fontsize=9)
     ax.set_ylim(0, 10)
     ax.set_title('Top 5 Professors - Radar Chart Comparison', 
@@ -204,7 +404,8 @@ def plot_professor_comparison(results_df):
     plt.tight_layout()
     plt.savefig('professor_radar_chart.png', dpi=300, bbox_inches='tight')
     print("Radar chart saved to 'professor_radar_chart.png'")
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
 
 
 def generate_summary_statistics(results_df):
@@ -216,25 +417,28 @@ def generate_summary_statistics(results_df):
     print("SUMMARY STATISTICS BY FACTOR")
     print("="*80)
     
-    plot_data = results_df.set_index('Professor')
+    # Row-major (professors x factors) score matrix; the statistics below reduce it directly
+    professor_names = results_df['Professor'].to_numpy()
+    factor_names = results_df.columns[1:]
+    scores = np.ascontiguousarray(results_df.iloc[:, 1:].to_numpy(dtype=np.float64))
     
-    for factor in plot_data.columns:
+    for j, factor in enumerate(factor_names):
         print(f"\n{factor.replace('_', ' ').upper()}:")
         print("-" * 80)
-        factor_data = plot_data[factor].dropna()
+        factor_data = scores[:, j]
         
-        print(f"Mean:   {factor_data.mean():.3f}")
-        print(f"Median: {factor_data.median():.3f}")
-        print(f"Std:    {factor_data.std():.3f}")
-        print(f"Min:    {factor_data.min():.3f} ({factor_data.idxmin()})")
-        print(f"Max:    {factor_data.max():.3f} ({factor_data.idxmax()})")
+        print(f"Mean:   {bn.nanmean(factor_data):.3f}")
+        print(f"Median: {bn.nanmedian(factor_data):.3f}")
+        print(f"Std:    {bn.nanstd(factor_data, ddof=1):.3f}")
+        print(f"Min:    {bn.nanmin(factor_data):.3f} ({professor_names[bn.nanargmin(factor_data)]})")
+        print(f"Max:    {bn.nanmax(factor_data):.3f} ({professor_names[bn.nanargmax(factor_data)]})")
     
     # Overall professor rankings
     print("\n" + "="*80)
     print("OVERALL PROFESSOR RANKINGS (Average across all 6 factors)")
     print("="*80)
     
-    results_df['Overall_Average'] = results_df.iloc[:, 1:].mean(axis=1)
+    results_df['Overall_Average'] = np.nanmean(scores, axis=1)
     ranked = results_df[['Professor', 'Overall_Average']].sort_values('Overall_Average', ascending=False)
     
     for rank, row in enumerate(ranked.itertuples(), 1):
@@ -244,8 +448,16 @@ def generate_summary_statistics(results_df):
 
 
 # MAIN EXECUTION
+numeric, prof_code, factor_code, data_shape = load_factor_matrix(file_path)
+
+print("="*80)
+print("PROFESSOR-SPECIFIC FACTOR ANALYSIS")
+print("="*80)
+print(f"Data loaded successfully! Shape: {data_shape}")
+print(f"Number of responses: {data_shape[0]}\n")
+
 print("Calculating mean scores for each professor across 6 factors...")
-results_df = calculate_professor_means()
+results_df = calculate_professor_means(numeric, prof_code, factor_code)
 
 # Display the results table
 print("\n" + "="*80)
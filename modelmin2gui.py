@@ -4,19 +4,25 @@ Attendance Optimizer - Fractional Simplex (single-file)
 
 Requirements:
     - Python 3.8+
-    - scipy
+    - numpy
     - tkinter (bundled with Python on most systems)
 
 Notes:
     - Uses tk.Label for colored result boxes so background/foreground work on macOS dark mode.
-    - If there are no inequality/equality constraints, we pass None to linprog for those args
-      to avoid dimension errors.
+    - The fractional LP is a unit-weight knapsack with per-instructor minimums, so it is
+      solved greedily in closed form instead of through scipy's linprog.
 """
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from scipy.optimize import linprog
 import math
+import numpy as np
+
+# Numba, when installed, compiles the greedy allocation kernel to native code
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # -------------------------
 # Data
@@ -39,6 +45,7 @@ PROFESSORS = [
     {"id": 15, "name": "Prof. Manish Kumar", "pv": 7.7, "le": 7.1, "se": 7.4, "ar": 8.1},
     {"id": 16, "name": "Prof. Sanjeewani Sehgal", "pv": 7.5, "le": 6.9, "se": 7.2, "ar": 7.7},
 ]
+PROFESSOR_BY_ID = {p["id"]: p for p in PROFESSORS}
 
 DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
 TIME_SLOTS = [
@@ -49,48 +56,92 @@ TIME_SLOTS = [
     {"id": 5, "time": "14:00-15:00", "block": "afternoon"},
     {"id": 6, "time": "15:00-16:00", "block": "afternoon"},
 ]
+SLOT_BLOCK = {s["id"]: s["block"] for s in TIME_SLOTS}
+
+# APS weights (chosen to sum roughly to 1.0): w1..w4 professor factors (pv, le, se, ar),
+# w5 time block, w6 holiday skip, w7/w8 travel time and time commitment penalties
+W_PROF = np.array([0.1476, 0.1456, 0.1370, 0.1356])
+W_TB, W_HS, W_TRAVEL, W_COMMIT = 0.1203, 0.1225, 0.0935, 0.0979
+TIME_BLOCK_RATINGS = {"morning": 7.5, "midday": 7.0, "afternoon": 6.5}
+HS_BASELINE = 5.0  # hypothetical holiday-skip baseline
+
+# Professor factor table, row i = PROFESSORS[i]
+PROF_TABLE = np.array([[p["pv"], p["le"], p["se"], p["ar"]] for p in PROFESSORS])
+PROF_INDEX = {p["id"]: i for i, p in enumerate(PROFESSORS)}
 
 # -------------------------
 # Helpers
 # -------------------------
 def find_professor(pid):
-    return next((p for p in PROFESSORS if p["id"] == pid), None)
+    return PROFESSOR_BY_ID.get(pid)
 
-def calculate_aps(instructor_id, time_block, student_profile):
+def calculate_aps(instructor_ids, time_blocks, student_profile):
     """
-    Returns APS score (a float) for a given instructor/timeblock/student.
+    Returns APS scores (a float array) for a batch of instructor/timeblock pairs and one student,
+    computed in a single vectorized pass. Unknown instructors score 0.0.
     The weight coefficients are arbitrary but normalized.
     """
-    prof = find_professor(instructor_id)
-    if prof is None:
-        return 0.0
-
-    timeBlockRatings = {"morning": 7.5, "midday": 7.0, "afternoon": 6.5}
-    # weights chosen to sum roughly to 1.0
-    weights = {
-        "w1": 0.1476, "w2": 0.1456, "w3": 0.1370, "w4": 0.1356,
-        "w5": 0.1203, "w6": 0.1225, "w7": 0.0935, "w8": 0.0979
-    }
-    TB = timeBlockRatings.get(time_block, 7.0)
-    HS = 5.0  # hypothetical holiday-skip baseline
+    prof_idx = np.array([PROF_INDEX.get(iid, -1) for iid in instructor_ids], dtype=np.intp)
+    TB = np.array([TIME_BLOCK_RATINGS.get(block, 7.0) for block in time_blocks])
+    pv, le, se, ar = PROF_TABLE[prof_idx].T
 
     aps = (
-        weights["w1"] * prof["pv"] +
-        weights["w2"] * prof["le"] +
-        weights["w3"] * prof["se"] +
-        weights["w4"] * prof["ar"] +
-        weights["w5"] * TB +
-        weights["w6"] * HS -
-        weights["w7"] * student_profile.get("travelTime", 0) -
-        weights["w8"] * student_profile.get("timeCommitment", 0)
+        W_PROF[0] * pv +
+        W_PROF[1] * le +
+        W_PROF[2] * se +
+        W_PROF[3] * ar +
+        W_TB * TB +
+        W_HS * HS_BASELINE -
+        W_TRAVEL * student_profile.get("travelTime", 0) -
+        W_COMMIT * student_profile.get("timeCommitment", 0)
     )
-    return round(aps, 4)
+    # Raw scores are the LP objective; the results window rounds aps to 4 places
+    return np.where(prof_idx >= 0, aps, 0.0)
+
+def _greedy_alloc(aps, groups, n_groups, required):
+    """
+    Closed-form optimum of the fractional attendance LP. aps holds the class scores,
+    groups each class's instructor index (0..n_groups-1).
+    This LP is a fractional knapsack with unit weights: the cheapest way to meet an
+    instructor minimum is their two best classes, and the remaining budget goes to the
+    best of the rest, splitting the last one. Returns (x, feasible).
+    """
+    n = aps.shape[0]
+    order = np.argsort(-aps, kind="mergesort")  # stable: ties keep timetable order
+    counts = np.zeros(n_groups, dtype=np.int64)
+    for i in range(n):
+        counts[groups[i]] += 1
+    x = np.zeros(n)
+    budget = required
+    for g in range(n_groups):
+        if counts[g] >= 2:
+            budget -= 2.0
+    taken = np.zeros(n_groups, dtype=np.int64)
+    for i in order:
+        g = groups[i]
+        if counts[g] >= 2 and taken[g] < 2:
+            x[i] = 1.0
+            taken[g] += 1
+    if budget < -1e-9:
+        # instructor minimums alone exceed the weekly requirement: infeasible
+        return x, False
+    for i in order:
+        if budget <= 0:
+            break
+        if x[i] == 0.0:
+            x[i] = min(1.0, budget)
+            budget -= x[i]
+    return x, True
+
+if njit is not None:
+    _greedy_alloc = njit(cache=True)(_greedy_alloc)
 
 def optimize_attendance_fractional(timetable, student_profile, weeks=20, attendance_target=0.75):
     """
     Linear program to pick fractional attendance (0..1 per slot) to maximize APS sum
     while matching required fraction of weekly classes (attendance_target).
-    Returns dict with results or None on failure.
+    Solved in closed form (greedy by APS), no LP solver call needed.
+    Returns dict with results or None if the constraints cannot be met.
     """
     total_weekly = len(timetable)
     if total_weekly == 0:
@@ -104,94 +155,37 @@ def optimize_attendance_fractional(timetable, student_profile, weeks=20, attenda
     total_semester = total_weekly * weeks
     required_semester = int(math.ceil(required_per_week * weeks))
 
-    # Build class_list preserving ordering for variable indexing
-    class_list = []
-    for key, cls in timetable.items():
-        slot = next((s for s in TIME_SLOTS if s["id"] == cls["slotId"]), None)
-        aps = calculate_aps(cls["instructorId"], slot["block"] if slot else "midday", student_profile)
-        class_list.append({**cls, "aps": aps, "key": key})
-
-    n = len(class_list)
-    if n == 0:
+    # Variables are indexed in timetable order; the entries are read in place, not copied
+    classes = list(timetable.values())
+    iids = [cls["instructorId"] for cls in classes]
+    blocks = [SLOT_BLOCK.get(cls["slotId"], "midday") for cls in classes]
+    aps = calculate_aps(iids, blocks, student_profile)
+
+    # Objective: maximize sum(aps * x) where 0 <= x <= 1, sum(x) == required_per_week,
+    # and for each instructor with >= 2 classes, sum of their x >= 2.
+    # Bucket classes by instructor with one sort: groups[i] is class i's instructor index,
+    # members[g] the (ascending) class indices of instructor g
+    uniq, first_seen, groups, counts = np.unique(np.array(iids), return_index=True, return_inverse=True, return_counts=True)
+    by_group = np.argsort(groups, kind="stable")
+    members = np.split(by_group, np.cumsum(counts)[:-1])
+
+    x, feasible = _greedy_alloc(aps, groups.astype(np.int64), len(uniq), float(required_per_week))
+    if not feasible:
         return None
 
-    # Objective: maximize sum(aps * x) where 0 <= x <= 1.
-    # linprog minimizes, so use -aps
-    c = [-cls["aps"] for cls in class_list]
-
-    # Equality constraint: sum(x_i) == required_per_week  (or we can allow small tolerance, but keep exact)
-    A_eq = [[1.0] * n]
-    b_eq = [required_per_week]
-
-    # Instructor minimum constraint: for each instructor with >= 2 classes, ensure sum >= 2
-    # Convert to A_ub * x <= b_ub form by multiplying by -1: -sum(indices) <= -2
-    A_ub = []
-    b_ub = []
-
-    instructor_map = {}
-    for idx, cls in enumerate(class_list):
-        iid = cls["instructorId"]
-        instructor_map.setdefault(iid, []).append(idx)
-
-    for iid, indices in instructor_map.items():
-        if len(indices) >= 2:
-            row = [0.0] * n
-            for i in indices:
-                row[i] = -1.0
-            A_ub.append(row)
-            b_ub.append(-2.0)
-
-    # If A_ub is empty, set to None to avoid shape issues
-    A_ub_arg = A_ub if len(A_ub) > 0 else None
-    b_ub_arg = b_ub if len(b_ub) > 0 else None
-    A_eq_arg = A_eq if len(A_eq) > 0 else None
-    b_eq_arg = b_eq if len(b_eq) > 0 else None
-
-    # Bounds for each variable 0..1
-    bounds = [(0.0, 1.0)] * n
-
-    # Solve
-    try:
-        res = linprog(
-            c=c,
-            A_ub=A_ub_arg,
-            b_ub=b_ub_arg,
-            A_eq=A_eq_arg,
-            b_eq=b_eq_arg,
-            bounds=bounds,
-            method='highs'
-        )
-    except Exception as e:
-        # As fallback try without instructor constraints
-        try:
-            res = linprog(
-                c=c,
-                A_ub=None,
-                b_ub=None,
-                A_eq=A_eq_arg,
-                b_eq=b_eq_arg,
-                bounds=bounds,
-                method='highs'
-            )
-        except Exception:
-            return None
-
-    if not res.success:
-        # second fallback: allow inequality sum(x) >= required_per_week converted to -sum <= -required_per_week
-        # but linprog doesn't support >=; to allow slack, we can try to relax equality to <= required_per_week
-        # Try relaxing equality to inequality sum(x) >= required_per_week by using bounds to push?
-        # For simplicity, return None if not successful
-        return None
-
-    # Build attendance fractions dict keyed by key
+    # Build attendance fractions dict keyed by key, for attended classes only
+    # (the results window shows absent keys as "Not selected")
     attendance_fractions = {}
-    for i, x in enumerate(res.x):
-        cls = class_list[i]
+    fractions = [0.0] * len(classes)
+    aps_list, x_list = aps.tolist(), x.tolist()
+    for i in np.flatnonzero(x > 1e-9).tolist():
+        cls, a, xi = classes[i], aps_list[i], x_list[i]
         key = f"{cls['day']}-{cls['slotId']}"
+        fractions[i] = float(round(xi, 3))
         attendance_fractions[key] = {
-            "fraction": float(round(x, 3)),
-            "aps": float(cls["aps"]),
-            "aps_weighted": float(round(x * cls["aps"], 3)),
+            "fraction": fractions[i],
+            "aps": float(round(a, 4)),
+            "aps_weighted": float(round(xi * a, 3)),
             "day": cls["day"],
             "slotId": cls["slotId"],
             "instructorId": cls["instructorId"],
@@ -204,15 +198,13 @@ def optimize_attendance_fractional(timetable, student_profile, weeks=20, attenda
     total_value = sum(v["aps_weighted"] for v in attendance_fractions.values())
     avg_value = (total_value / total_frac_week) if total_frac_week > 0 else 0.0
 
-    # Instructor stats
+    # Instructor stats, reusing the per-instructor class buckets (in timetable order)
     instructor_stats = {}
-    for cls in class_list:
-        iid = cls["instructorId"]
-        instructor_stats.setdefault(iid, {"name": find_professor(iid)["name"] if find_professor(iid) else f"#{iid}", "total": 0, "attended": 0.0})
-        instructor_stats[iid]["total"] += 1
-        key = f"{cls['day']}-{cls['slotId']}"
-        if key in attendance_fractions:
-            instructor_stats[iid]["attended"] += attendance_fractions[key]["fraction"]
+    for g in np.argsort(first_seen).tolist():
+        iid = int(uniq[g])
+        prof = find_professor(iid)
+        instructor_stats[iid] = {"name": prof["name"] if prof else f"#{iid}", "total": int(counts[g]),
+                                 "attended": sum(fractions[i] for i in members[g].tolist())}
 
     result = {
         "attendance_fractions": attendance_fractions,
@@ -226,7 +218,7 @@ def optimize_attendance_fractional(timetable, student_profile, weeks=20, attenda
         "totalValue": round(total_value, 3),
         "avgValue": round(avg_value, 4),
         "instructorStats": instructor_stats,
-        "optimal": res.success
+        "optimal": True
     }
     return result
 
@@ -242,10 +234,14 @@ class AttendanceApp(tk.Tk):
 
         # default profile
         self.student_profile = {"travelTime": 2.0, "timeCommitment": 0.5}
-        self.timetable = {}  # key -> {day, slotId, instructorId, subject}
+        self.timetable = {}  # key -> {day, slotId, instructorId, subject, _display}
         self.optimized = None
+        self._results_win = None
+        self._pending_removal = set()  # keys shift-clicked for "Delete Selected"
 
         self._build_ui()
+        # Compile (or load the cached) greedy kernel now, not on the first Optimize click
+        _greedy_alloc(np.zeros(1), np.zeros(1, dtype=np.int64), 1, 0.0)
 
     def _build_ui(self):
         # Top controls
@@ -256,24 +252,31 @@ class AttendanceApp(tk.Tk):
         profile_frame.pack(side=tk.LEFT, padx=6)
 
         ttk.Label(profile_frame, text="Travel Time:").grid(row=0, column=0, padx=4, pady=4)
-        self.travel_cb = ttk.Combobox(profile_frame, state="readonly", width=18,
-                                      values=["Under 15 min|1.0", "15-30 min|1.5", "30-60 min|2.0", "60-90 min|2.5", "Over 90 min|3.0"])
+        travel_vals = ["Under 15 min|1.0", "15-30 min|1.5", "30-60 min|2.0", "60-90 min|2.5", "Over 90 min|3.0"]
+        self.travel_cb = ttk.Combobox(profile_frame, state="readonly", width=18, values=travel_vals)
         self.travel_cb.current(2)
         self.travel_cb.grid(row=0, column=1, padx=4, pady=4)
         self.travel_cb.bind("<<ComboboxSelected>>", self._on_profile_change)
 
         ttk.Label(profile_frame, text="Time Commitment:").grid(row=1, column=0, padx=4, pady=4)
-        self.commit_cb = ttk.Combobox(profile_frame, state="readonly", width=18,
-                                      values=["No commitments|0.0", "Society/Club/Sports|0.5", "Part-time job|1.0"])
+        commit_vals = ["No commitments|0.0", "Society/Club/Sports|0.5", "Part-time job|1.0"]
+        self.commit_cb = ttk.Combobox(profile_frame, state="readonly", width=18, values=commit_vals)
         self.commit_cb.current(1)
         self.commit_cb.grid(row=1, column=1, padx=4, pady=4)
         self.commit_cb.bind("<<ComboboxSelected>>", self._on_profile_change)
 
+        # Combobox entries are fixed, so parse their values once; handlers index by current()
+        self._travel_by_index = [float(v.split("|")[1]) for v in travel_vals]
+        self._commit_by_index = [float(v.split("|")[1]) for v in commit_vals]
+        self._slot_id_by_index = [s["id"] for s in TIME_SLOTS]
+        self._prof_id_by_index = [p["id"] for p in PROFESSORS]
+
         btn_frame = ttk.Frame(top)
         btn_frame.pack(side=tk.RIGHT, padx=6)
         ttk.Button(btn_frame, text="Optimize (Fractional)", command=self._optimize_click).grid(row=0, column=0, padx=4)
         ttk.Button(btn_frame, text="Clear Timetable", command=self._clear_timetable).grid(row=0, column=1, padx=4)
-        ttk.Button(btn_frame, text="Show Instructors", command=self._show_instructors).grid(row=0, column=2, padx=4)
+        ttk.Button(btn_frame, text="Delete Selected", command=self._delete_selected).grid(row=0, column=2, padx=4)
+        ttk.Button(btn_frame, text="Show Instructors", command=self._show_instructors).grid(row=0, column=3, padx=4)
 
         # Main: left add form, right timetable
         main = ttk.Frame(self)
@@ -337,12 +340,13 @@ class AttendanceApp(tk.Tk):
                 cell = ttk.Frame(self.table_frame, relief=tk.GROOVE, borderwidth=1, width=220, height=42)
                 cell.grid_propagate(False)
                 cell.grid(row=r, column=c, sticky="nsew", padx=2, pady=2)
-                lbl = ttk.Label(cell, text="(empty)", anchor=tk.CENTER)
+                lbl = ttk.Label(cell, text="(empty)", anchor=tk.CENTER, justify=tk.CENTER)
                 lbl.pack(expand=True, fill=tk.BOTH)
                 key = f"{day}-{slot['id']}"
                 self.cell_widgets[key] = (cell, lbl)
-                # bind click to remove
+                # bind click to remove, shift-click to mark for bulk removal
                 lbl.bind("<Button-1>", lambda e, k=key: self._cell_clicked(k))
+                lbl.bind("<Shift-Button-1>", lambda e, k=key: self._cell_shift_clicked(k))
 
         # Bottom summary
         bottom = ttk.Frame(self)
@@ -351,20 +355,14 @@ class AttendanceApp(tk.Tk):
         self.total_label.pack(side=tk.LEFT, padx=6)
 
     def _on_profile_change(self, event=None):
-        try:
-            travel_val = float(self.travel_cb.get().split("|")[1])
-            commit_val = float(self.commit_cb.get().split("|")[1])
-            self.student_profile["travelTime"] = travel_val
-            self.student_profile["timeCommitment"] = commit_val
-        except Exception:
-            pass
+        self.student_profile["travelTime"] = self._travel_by_index[self.travel_cb.current()]
+        self.student_profile["timeCommitment"] = self._commit_by_index[self.commit_cb.current()]
 
     def _add_class(self):
         day = self.day_cb.get()
         slot_text = self.slot_cb.get()
-        slot_id = int(slot_text.split(".")[0])
-        prof_text = self.prof_cb.get()
-        prof_id = int(prof_text.split(".")[0])
+        slot_id = self._slot_id_by_index[self.slot_cb.current()]
+        prof_id = self._prof_id_by_index[self.prof_cb.current()]
         subject = self.subject_entry.get().strip() or "(no subject)"
         key = f"{day}-{slot_id}"
 
@@ -372,7 +370,12 @@ class AttendanceApp(tk.Tk):
             if not messagebox.askyesno("Overwrite?", f"A class already exists at {day} {slot_text}. Overwrite?"):
                 return
 
-        self.timetable[key] = {"day": day, "slotId": slot_id, "instructorId": prof_id, "subject": subject}
+        # Cell text is fixed once the class is added, so format it here rather than on every repaint
+        prof = find_professor(prof_id)
+        display = f"{subject}\n{prof['name'] if prof else f'Instructor #{prof_id}'}"
+        self._pending_removal.discard(key)
+        self.timetable[key] = {"day": day, "slotId": slot_id, "instructorId": prof_id, "subject": subject,
+                               "_display": display}
         self._update_cell_ui(key)
         self._update_total_label()
         self.subject_entry.delete(0, tk.END)
@@ -381,25 +384,43 @@ class AttendanceApp(tk.Tk):
         if key in self.timetable:
             if messagebox.askyesno("Remove class", f"Remove class at {key.replace('-', ' slot ')}?"):
                 del self.timetable[key]
+                self._pending_removal.discard(key)
                 self._update_cell_ui(key)
                 self._update_total_label()
 
-    def _update_cell_ui(self, key):
-        cell, old_lbl = self.cell_widgets[key]
-        for w in cell.winfo_children():
-            w.destroy()
+    def _cell_shift_clicked(self, key):
+        # Tk fires only the more specific <Shift-Button-1> binding, so no removal prompt here
+        if key not in self.timetable:
+            return
+        if key in self._pending_removal:
+            self._pending_removal.remove(key)
+            self.cell_widgets[key][1].configure(foreground="")
+        else:
+            self._pending_removal.add(key)
+            self.cell_widgets[key][1].configure(foreground="red")
+
+    def _delete_selected(self):
+        if not self._pending_removal:
+            messagebox.showinfo("Delete Selected", "Shift-click classes to select them for removal.")
+            return
+        n = len(self._pending_removal)
+        if not messagebox.askyesno("Delete Selected", f"Remove {n} selected class{'es' if n != 1 else ''}?"):
+            return
+        for k in self._pending_removal:
+            self.timetable.pop(k, None)
+            self.cell_widgets[k][1].configure(text="(empty)", foreground="")
+        self._pending_removal.clear()
+        self._update_total_label()
+        # one layout pass for the whole batch, as in _clear_timetable
+        self.table_frame.update_idletasks()
 
+    def _update_cell_ui(self, key):
+        _, lbl = self.cell_widgets[key]
         if key in self.timetable:
-            cls = self.timetable[key]
-            prof = find_professor(cls["instructorId"])
-            text = f"{cls['subject']}\n{prof['name'] if prof else f'Instructor #{cls['instructorId']}'}"
-            label = ttk.Label(cell, text=text, anchor=tk.CENTER, justify=tk.CENTER)
-            label.pack(expand=True, fill=tk.BOTH)
-            label.bind("<Button-1>", lambda e, k=key: self._cell_clicked(k))
+            lbl.configure(text=self.timetable[key]["_display"],
+                          foreground="red" if key in self._pending_removal else "")
         else:
-            label = ttk.Label(cell, text="(empty)", anchor=tk.CENTER)
-            label.pack(expand=True, fill=tk.BOTH)
-            label.bind("<Button-1>", lambda e, k=key: self._cell_clicked(k))
+            lbl.configure(text="(empty)", foreground="")
 
     def _update_total_label(self):
         total = len(self.timetable)
@@ -407,10 +428,15 @@ class AttendanceApp(tk.Tk):
 
     def _clear_timetable(self):
         if messagebox.askyesno("Clear", "Clear entire timetable?"):
+            # Only populated cells change, and all of them go back to "(empty)"
+            changed = list(self.timetable)
             self.timetable.clear()
-            for k in list(self.cell_widgets.keys()):
-                self._update_cell_ui(k)
+            for k in changed:
+                self.cell_widgets[k][1].configure(text="(empty)", foreground="")
+            self._pending_removal.clear()
             self._update_total_label()
+            # one layout pass for the whole batch, before the info dialog opens
+            self.table_frame.update_idletasks()
             self.optimized = None
             messagebox.showinfo("Cleared", "Timetable cleared.")
 
@@ -431,20 +457,20 @@ class AttendanceApp(tk.Tk):
         self.optimized = res
         self._show_optimization_result(res)
 
-    def _show_optimization_result(self, res):
+    def _build_results_window(self):
         win = tk.Toplevel(self)
         win.title("Optimization Results - Fractional Attendance")
         win.geometry("1000x650")
+        # Closing only hides the window so the next optimize can reuse its widgets
+        win.protocol("WM_DELETE_WINDOW", win.withdraw)
 
         top_frame = ttk.Frame(win)
         top_frame.pack(fill=tk.X, padx=8, pady=6)
-
-        ttk.Label(top_frame, text=f"Total Classes/Week: {res['totalClassesWeek']}", width=28).grid(row=0, column=0, padx=6)
-        ttk.Label(top_frame, text=f"Total Classes/Semester: {res['totalClassesSemester']}", width=28).grid(row=0, column=1, padx=6)
-        ttk.Label(top_frame, text=f"Required (75%): {res['requiredClassesWeek']}/week", width=28).grid(row=0, column=2, padx=6)
-        ttk.Label(top_frame, text=f"Attending: {res['totalFractionalClassesWeek']}/week", width=28).grid(row=1, column=0, padx=6)
-        ttk.Label(top_frame, text=f"Total Attending (semester): {res['totalSelectedSemester']}", width=28).grid(row=1, column=1, padx=6)
-        ttk.Label(top_frame, text=f"Avg APS: {res['avgValue']}", width=28).grid(row=1, column=2, padx=6)
+        self._results_summary = []
+        for row, col in [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]:
+            lbl = ttk.Label(top_frame, width=28)
+            lbl.grid(row=row, column=col, padx=6)
+            self._results_summary.append(lbl)
 
         # Table of weekly slots with color-coded boxes (use tk.Label for colors)
         table_frame = ttk.Frame(win)
@@ -454,51 +480,20 @@ class AttendanceApp(tk.Tk):
         for c, day in enumerate(DAYS, start=1):
             ttk.Label(table_frame, text=day, relief=tk.RIDGE, width=28).grid(row=0, column=c, sticky="nsew")
 
-        attendance = res["attendance_fractions"]
-
+        self._results_cells = {}
         for r, slot in enumerate(TIME_SLOTS, start=1):
             ttk.Label(table_frame, text=slot["time"], relief=tk.RIDGE, width=18).grid(row=r, column=0, sticky="nsew")
             for c, day in enumerate(DAYS, start=1):
-                key = f"{day}-{slot['id']}"
                 frame = ttk.Frame(table_frame, relief=tk.GROOVE, borderwidth=1, width=220, height=50)
                 frame.grid_propagate(False)
                 frame.grid(row=r, column=c, sticky="nsew", padx=2, pady=2)
-
-                if key in self.timetable:
-                    cls = self.timetable[key]
-                    # Only show Instructor number (not full name) in the final optimized grid
-                    txt = f"{cls['subject']}\nInstructor {cls['instructorId']}"
-
-                    if key in attendance:
-                        fraction = attendance[key]["fraction"]
-                        aps = attendance[key]["aps"]
-
-                        # Choose background (colored boxes) and BLACK text for readability
-                        if fraction >= 0.9:
-                            bg_color = "#8BF28B"   # Green
-                        elif fraction >= 0.7:
-                            bg_color = "#F8E969"   # Yellow
-                        elif fraction >= 0.4:
-                            bg_color = "#F5A572"   # Orange
-                        else:
-                            bg_color = "#F28181"   # Red
-
-                        fg_color = "#000000"  # Always black text
-
-                        # Use tk.Label for colored backgrounds to work on macOS (ttk ignores bg)
-                        lbl = tk.Label(frame, text=txt, anchor="center", justify="center", bg=bg_color, fg=fg_color)
-                        lbl.pack(expand=True, fill="both")
-                        info_lbl = tk.Label(frame, text=f"Attend: {int(fraction*100)}% (APS: {aps})",
-                                            font=("TkDefaultFont", 8, "bold"), bg=bg_color, fg=fg_color)
-                        info_lbl.pack()
-                    else:
-                        # Not selected (shouldn't usually happen if timetable contains it, but safe)
-                        lbl = tk.Label(frame, text=txt + "\nNot selected (0%)", anchor="center", justify="center",
-                                       bg="#ffffff", fg="#000000")
-                        lbl.pack(expand=True, fill="both")
-                else:
-                    # empty slot
-                    ttk.Label(frame, text="").pack()
+                # Use tk.Label for colored backgrounds to work on macOS (ttk ignores bg)
+                lbl = tk.Label(frame, anchor="center", justify="center")
+                lbl.pack(expand=True, fill="both")
+                info_lbl = tk.Label(frame, font=("TkDefaultFont", 8, "bold"))
+                info_lbl.pack()
+                self._results_cells[f"{day}-{slot['id']}"] = (lbl, info_lbl)
+        self._results_default_colors = (lbl.cget("bg"), lbl.cget("fg"))
 
         # Instructor stats treeview
         stats_frame = ttk.LabelFrame(win, text="Instructor-wise Fractional Attendance")
@@ -513,7 +508,68 @@ class AttendanceApp(tk.Tk):
         tree.column("semester_frac", width=160, anchor=tk.CENTER)
         tree.column("percent", width=120, anchor=tk.CENTER)
         tree.pack(fill=tk.BOTH, expand=True)
+        self._results_tree = tree
+
+        # explanatory note and close
+        ttk.Label(win, text="Note: Fractional attendance means attending that percentage of occurrences.\nE.g., 0.75 = attend 15 out of 20 lectures for that slot.",
+                  font=("TkDefaultFont", 9, "italic")).pack(pady=6)
+        ttk.Button(win, text="Close", command=win.withdraw).pack(pady=4)
+        self._results_win = win
+
+    def _show_optimization_result(self, res):
+        # Build the results window once, then only re-config its widgets
+        if self._results_win is None or not self._results_win.winfo_exists():
+            self._build_results_window()
+        win = self._results_win
+
+        summary = [
+            f"Total Classes/Week: {res['totalClassesWeek']}",
+            f"Total Classes/Semester: {res['totalClassesSemester']}",
+            f"Required (75%): {res['requiredClassesWeek']}/week",
+            f"Attending: {res['totalFractionalClassesWeek']}/week",
+            f"Total Attending (semester): {res['totalSelectedSemester']}",
+            f"Avg APS: {res['avgValue']}",
+        ]
+        for lbl, text in zip(self._results_summary, summary):
+            lbl.configure(text=text)
+
+        attendance = res["attendance_fractions"]
+        default_bg, default_fg = self._results_default_colors
+        for key, (lbl, info_lbl) in self._results_cells.items():
+            if key in self.timetable:
+                cls = self.timetable[key]
+                # Only show Instructor number (not full name) in the final optimized grid
+                txt = f"{cls['subject']}\nInstructor {cls['instructorId']}"
+
+                if key in attendance:
+                    fraction = attendance[key]["fraction"]
+                    aps = attendance[key]["aps"]
+
+                    # Choose background (colored boxes) and BLACK text for readability
+                    if fraction >= 0.9:
+                        bg_color = "#8BF28B"   # Green
+                    elif fraction >= 0.7:
+                        bg_color = "#F8E969"   # Yellow
+                    elif fraction >= 0.4:
+                        bg_color = "#F5A572"   # Orange
+                    else:
+                        bg_color = "#F28181"   # Red
 
+                    fg_color = "#000000"  # Always black text
+                    info = f"Attend: {int(fraction*100)}% (APS: {aps})"
+                else:
+                    # Not selected (shouldn't usually happen if timetable contains it, but safe)
+                    txt += "\nNot selected (0%)"
+                    bg_color, fg_color, info = "#ffffff", "#000000", ""
+            else:
+                # empty slot
+                txt, info = "", ""
+                bg_color, fg_color = default_bg, default_fg
+            lbl.configure(text=txt, bg=bg_color, fg=fg_color)
+            info_lbl.configure(text=info, bg=bg_color, fg=fg_color)
+
+        tree = self._results_tree
+        tree.delete(*tree.get_children())
         for iid, stats in res["instructorStats"].items():
             total = stats["total"]
             attended = stats["attended"]
@@ -522,10 +578,8 @@ class AttendanceApp(tk.Tk):
             semester_text = f"{attended*20:.1f}/{total*20}"
             tree.insert("", "end", values=(weekly_text, semester_text, f"{percent}%"), text=f"#{iid} - {stats['name']}")
 
-        # explanatory note and close
-        ttk.Label(win, text="Note: Fractional attendance means attending that percentage of occurrences.\nE.g., 0.75 = attend 15 out of 20 lectures for that slot.",
-                  font=("TkDefaultFont", 9, "italic")).pack(pady=6)
-        ttk.Button(win, text="Close", command=win.destroy).pack(pady=4)
+        win.deiconify()
+        win.lift()
 
 # -------------------------
 # Run
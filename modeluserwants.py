@@ -1,7 +1,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from scipy.optimize import linprog
+from scipy.sparse import csr_matrix
+import numpy as np
+import functools
 import math
+import concurrent.futures
 
 # -------------------------
 # Data
@@ -24,6 +28,7 @@ PROFESSORS = [
     {"id": 15, "name": "Prof. Manish Kumar", "pv": 7.7, "le": 7.1, "se": 7.4, "ar": 8.1},
     {"id": 16, "name": "Prof. Sanjeewani Sehgal", "pv": 7.5, "le": 6.9, "se": 7.2, "ar": 7.7},
 ]
+PROFESSOR_BY_ID = {p["id"]: p for p in PROFESSORS}
 
 DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
 
@@ -35,6 +40,7 @@ TIME_SLOTS = [
     {"id": 5, "time": "14:00-15:00", "block": "afternoon"},
     {"id": 6, "time": "15:00-16:00", "block": "afternoon"},
 ]
+SLOT_BLOCK = {s["id"]: s["block"] for s in TIME_SLOTS}
 
 # Priority levels Option C (5-level)
 PRIORITY_LEVELS = ["Very High", "High", "Medium", "Low", "Avoid"]
@@ -46,43 +52,163 @@ PRIORITY_MULTIPLIER = {
     "Avoid": 0.80
 }
 
+# APS weights: w1..w4 professor factors (pv, le, se, ar), w5 time block, w6 holiday skip,
+# w7/w8 travel time and time commitment penalties
+W_PROF = np.array([0.1476, 0.1456, 0.1370, 0.1356])
+W_TB, W_HS, W_TRAVEL, W_COMMIT = 0.1203, 0.1225, 0.0935, 0.0979
+TIME_BLOCK_RATINGS = {"morning": 7.5, "midday": 7.0, "afternoon": 6.5}
+HS_BASELINE = 5.0
+
+# Professor factor table, row i = PROFESSORS[i]
+PROF_TABLE = np.array([[p["pv"], p["le"], p["se"], p["ar"]] for p in PROFESSORS])
+PROF_INDEX = {p["id"]: i for i, p in enumerate(PROFESSORS)}
+
+# "Show Instructors" line prefixes; only the priority suffix changes between clicks
+INSTRUCTOR_LABELS = [(p["id"], f"#{p['id']} - {p['name']}  (Priority: ") for p in PROFESSORS]
+
 
 # -------------------------
 # Helper functions
 # -------------------------
 def find_professor(pid):
-    return next((p for p in PROFESSORS if p["id"] == pid), None)
+    return PROFESSOR_BY_ID.get(pid)
 
 
-def calculate_aps(instructor_id, time_block, student_profile, priorities):
+def timetable_columns(timetable):
     """
-    Base APS calculation, then scaled by priority multiplier for professor.
+    Column view of a timetable dict: its keys plus parallel slot-id and instructor-id
+    arrays, read in one pass so the optimizer never goes back to the per-class dicts.
     """
-    prof = find_professor(instructor_id)
-    if prof is None:
-        return 0.0
-    timeBlockRatings = {"morning": 7.5, "midday": 7.0, "afternoon": 6.5}
-    weights = {
-        "w1": 0.1476, "w2": 0.1456, "w3": 0.1370, "w4": 0.1356,
-        "w5": 0.1203, "w6": 0.1225, "w7": 0.0935, "w8": 0.0979
-    }
-    TB = timeBlockRatings.get(time_block, 7.0)
-    HS = 5.0
+    n = len(timetable)
+    keys = [None] * n
+    slot_ids = np.empty(n, dtype=np.intp)
+    instructor_ids = np.empty(n, dtype=np.intp)
+    for i, (key, cls) in enumerate(timetable.items()):
+        keys[i] = key
+        slot_ids[i] = cls["slotId"]
+        instructor_ids[i] = cls["instructorId"]
+    return keys, slot_ids, instructor_ids
+
+
+def calculate_aps(instructor_ids, time_blocks, student_profile, priorities):
+    """
+    Base APS for a batch of classes in one vectorized pass, then scaled by each
+    professor's priority multiplier. Unknown instructors score 0.0.
+    """
+    prof_idx = np.array([PROF_INDEX.get(iid, -1) for iid in instructor_ids], dtype=np.intp)
+    tb = np.array([TIME_BLOCK_RATINGS.get(block, 7.0) for block in time_blocks])
+    # Apply priority multiplier (default Medium if not found)
+    mult = np.array([PRIORITY_MULTIPLIER.get(priorities.get(iid, "Medium"), 1.10) for iid in instructor_ids])
+    pv, le, se, ar = PROF_TABLE[prof_idx].T
+    # Same term order as the original scalar formula
     aps_base = (
-        weights["w1"] * prof["pv"] +
-        weights["w2"] * prof["le"] +
-        weights["w3"] * prof["se"] +
-        weights["w4"] * prof["ar"] +
-        weights["w5"] * TB +
-        weights["w6"] * HS -
-        weights["w7"] * student_profile.get("travelTime", 0.0) -
-        weights["w8"] * student_profile.get("timeCommitment", 0.0)
+        W_PROF[0] * pv +
+        W_PROF[1] * le +
+        W_PROF[2] * se +
+        W_PROF[3] * ar +
+        W_TB * tb +
+        W_HS * HS_BASELINE -
+        W_TRAVEL * student_profile.get("travelTime", 0.0) -
+        W_COMMIT * student_profile.get("timeCommitment", 0.0)
     )
-    # Apply priority multiplier (default Medium if not found)
-    level = priorities.get(instructor_id, "Medium")
-    mult = PRIORITY_MULTIPLIER.get(level, 1.10)
-    aps_final = aps_base * mult
-    return round(aps_final, 3)
+    # Left raw for _solve_lp; optimize_attendance_simplex rounds the aps, fraction
+    # and aps_weighted fields it reports, one value at a time
+    return np.where(prof_idx >= 0, aps_base * mult, 0.0)
+
+
+@functools.lru_cache(maxsize=128)
+def _instructor_constraints(instructor_ids):
+    """
+    A_ub/b_ub for the instructor minimum rows. They depend only on which instructor
+    teaches each class, so profile or priority changes reuse the cached matrices
+    (shared between callers, do not modify). Returns (None, None) if no row applies.
+    """
+    # Instructor minimum constraint: if instructor has >=2 classes in week, try to ensure at least 2 aggregated (as in original).
+    # Implement as A_ub with -sum >= -2 -> -(sum) <= -2 (same structure)
+    # Each row only touches that instructor's classes, so it is assembled sparse from (row, col) pairs
+    A_ub = None
+    b_ub = None
+    _, first_seen, inverse, counts = np.unique(np.asarray(instructor_ids), return_index=True,
+                                               return_inverse=True, return_counts=True)
+    # One row per instructor with >= 2 classes, numbered in first-seen order
+    by_first_seen = np.argsort(first_seen)
+    constrained = by_first_seen[counts[by_first_seen] >= 2]
+    n_ub = len(constrained)
+    row_of = np.full(len(counts), -1)
+    row_of[constrained] = np.arange(n_ub)
+    cols = np.flatnonzero(row_of[inverse] >= 0)
+    rows = row_of[inverse[cols]]
+    if n_ub:
+        A_ub = csr_matrix((-np.ones(len(cols)), (rows, cols)), shape=(n_ub, len(instructor_ids)))
+        b_ub = np.full(n_ub, -2.0)
+        b_ub.flags.writeable = False
+    return A_ub, b_ub
+
+
+@functools.lru_cache(maxsize=128)
+def _solve_lp(aps, instructor_ids, required_per_week):
+    """
+    Solve the fractional attendance LP for one set of class scores, instructors and
+    weekly requirement. Returns the (read-only) solution vector, or None if HiGHS
+    finds no solution even with the instructor constraints relaxed.
+    """
+    n = len(aps)
+
+    # Objective coefficients (minimize) -> use negative APS to maximize
+    c = -np.array(aps)
+
+    A_ub, b_ub = _instructor_constraints(instructor_ids)
+
+    # Closed form first: without the instructor rows the LP is a unit-weight fractional
+    # knapsack, solved by attending the best floor(required) classes fully and a fraction
+    # of the next one. If that already meets every instructor minimum it is optimal.
+    order = np.argsort(c, kind="stable")
+    k = int(required_per_week)
+    x = np.zeros(n)
+    x[order[:k]] = 1.0
+    if k < n:
+        x[order[k]] = required_per_week - k
+    active = A_ub @ x > b_ub + 1e-9 if A_ub is not None else None
+    if active is None or not active.any():
+        x.flags.writeable = False  # shared between cache hits
+        return x
+
+    # Equality constraint: sum(x_i) = required_per_week (only needed once HiGHS runs)
+    A_eq = csr_matrix(np.ones((1, n)))
+    b_eq = np.array([required_per_week])
+
+    # Variable bounds 0..1 (a single pair applies to every variable)
+    bounds = (0.0, 1.0)
+
+    # Solve: dual simplex without presolve, which costs more than the solve itself at this size
+    options = {"presolve": False, "disp": False}
+
+    # Active set: solve with only the instructor rows seen violated so far, adding any the
+    # new solution breaks. Dropping rows only relaxes the LP, so a solution meeting all of
+    # them is optimal for the full problem. After a few rounds fall back to every row.
+    for _ in range(3):
+        result = linprog(c=c, A_ub=A_ub[active], b_ub=b_ub[active],
+                         A_eq=A_eq, b_eq=b_eq, bounds=bounds, method='highs-ds', options=options)
+        if not result.success:
+            break  # infeasible with a subset of rows, so also with all of them
+        violated = (A_ub @ result.x > b_ub + 1e-6) & ~active
+        if not violated.any():
+            break
+        active |= violated
+    else:
+        result = linprog(c=c, A_ub=A_ub, b_ub=b_ub,
+                         A_eq=A_eq, b_eq=b_eq, bounds=bounds, method='highs-ds', options=options)
+
+    # If solver fails with instructor constraints, relax them
+    if not result.success and A_ub is not None:
+        result = linprog(c=c, A_ub=None, b_ub=None, A_eq=A_eq, b_eq=b_eq, bounds=bounds,
+                         method='highs-ds', options=options)
+    if not result.success:
+        return None
+
+    x = result.x
+    x.flags.writeable = False  # shared between cache hits
+    return x
 
 
 def optimize_attendance_simplex(timetable, student_profile, priorities, desired_attendance_percent):
@@ -108,82 +234,46 @@ def optimize_attendance_simplex(timetable, student_profile, priorities, desired_
     total_classes_semester = total_classes_per_week * weeks
     required_classes_semester = int(math.ceil(required_per_week * weeks))
 
-    # Build class list and APS values
-    class_list = []
-    for key, cls in timetable.items():
-        slot = next((s for s in TIME_SLOTS if s["id"] == cls["slotId"]), None)
-        aps = calculate_aps(cls["instructorId"], slot["block"] if slot else "midday", student_profile, priorities)
-        class_list.append({**cls, "aps": aps, "key": key})
-    n = len(class_list)
-    if n == 0:
-        return None
-
-    # Objective coefficients (minimize) -> use negative APS to maximize
-    c = [-cls["aps"] for cls in class_list]
-
-    # Equality constraint: sum(x_i) = required_per_week
-    A_eq = [[1.0] * n]
-    b_eq = [required_per_week]
-
-    # Instructor minimum constraint: if instructor has >=2 classes in week, try to ensure at least 2 aggregated (as in original).
-    # Implement as A_ub with -sum >= -2 -> -(sum) <= -2 (same structure)
-    A_ub = []
-    b_ub = []
-    instructor_classes = {}
-    for i, cls in enumerate(class_list):
-        iid = cls["instructorId"]
-        instructor_classes.setdefault(iid, []).append(i)
-    for iid, indices in instructor_classes.items():
-        if len(indices) >= 2:
-            row = [0.0] * n
-            for idx in indices:
-                row[idx] = -1.0
-            A_ub.append(row)
-            b_ub.append(-2.0)
-
-    # Variable bounds 0..1
-    bounds = [(0.0, 1.0) for _ in range(n)]
-
-    # Solve
-    result = linprog(c=c, A_ub=A_ub if A_ub else None, b_ub=b_ub if b_ub else None,
-                     A_eq=A_eq, b_eq=b_eq, bounds=bounds, method='highs')
+    # Columnar class data and APS values
+    keys, slot_ids, iids = timetable_columns(timetable)
+    blocks = [SLOT_BLOCK.get(sid, "midday") for sid in slot_ids.tolist()]
+    aps = calculate_aps(iids.tolist(), blocks, student_profile, priorities)
 
-    # If solver fails with instructor constraints, relax them
-    if not result.success and A_ub:
-        result = linprog(c=c, A_ub=None, b_ub=None, A_eq=A_eq, b_eq=b_eq, bounds=bounds, method='highs')
-        if not result.success:
-            return None
+    # Solve (memoized on the LP data, so an unchanged setup skips HiGHS)
+    x = _solve_lp(tuple(aps.tolist()), tuple(iids.tolist()), required_per_week)
+    if x is None:
+        return None
 
-    # Build attendance fractions
+    # Build attendance fractions, rounding each reported value with round() as the
+    # scalar code did (np.round's scale-and-rint can differ by 0.001 on near-ties)
     attendance_fractions = {}
-    for i, val in enumerate(result.x):
-        cls = class_list[i]
-        key = f"{cls['day']}-{cls['slotId']}"
+    for key, a, xi in zip(keys, aps.tolist(), x.tolist()):
         attendance_fractions[key] = {
-            **cls,
-            "fraction": round(float(val), 3),
-            "aps_weighted": round(float(val) * cls["aps"], 3),
-            "aps": cls["aps"]
+            **timetable[key],
+            "aps": round(a, 3),
+            "key": key,
+            "fraction": round(xi, 3),
+            "aps_weighted": round(xi * a, 3)
         }
 
-    total_fractional_classes = sum(af["fraction"] for af in attendance_fractions.values())
+    # Totals straight from the solution vector
+    total_fractional_classes = float(x.sum())
     total_selected_semester = total_fractional_classes * weeks
     attendance_percentage = (total_selected_semester / total_classes_semester * 100.0) if total_classes_semester > 0 else 0.0
-    total_value = sum(af["aps_weighted"] for af in attendance_fractions.values())
+    total_value = float(x @ aps)
     avg_value = (total_value / total_fractional_classes) if total_fractional_classes > 0 else 0.0
 
-    # Per-instructor stats
+    # Per-instructor stats: class counts and attended fractions in one bincount each
+    unique_iids, first_seen, inverse = np.unique(iids, return_index=True, return_inverse=True)
+    totals = np.bincount(inverse)
+    attended = np.bincount(inverse, weights=x)
     instructor_stats = {}
-    for cls in class_list:
-        iid = cls["instructorId"]
-        if iid not in instructor_stats:
-            # store name in stats internally, but it will not be shown in final output
-            prof = find_professor(iid)
-            instructor_stats[iid] = {"name": prof["name"] if prof else f"#{iid}", "total": 0, "attended": 0.0}
-        instructor_stats[iid]["total"] += 1
-        key = f"{cls['day']}-{cls['slotId']}"
-        if key in attendance_fractions:
-            instructor_stats[iid]["attended"] += attendance_fractions[key]["fraction"]
+    for j in np.argsort(first_seen):  # keep timetable order for the stats table
+        iid = int(unique_iids[j])
+        # store name in stats internally, but it will not be shown in final output
+        prof = find_professor(iid)
+        instructor_stats[iid] = {"name": prof["name"] if prof else f"#{iid}",
+                                 "total": int(totals[j]), "attended": float(attended[j])}
 
     return {
         "attendance_fractions": attendance_fractions,
@@ -197,13 +287,68 @@ def optimize_attendance_simplex(timetable, student_profile, priorities, desired_
         "totalValue": round(total_value, 3),
         "avgValue": round(avg_value, 3),
         "instructorStats": instructor_stats,
-        "optimal": result.success
+        "optimal": True
     }
 
 
 # -------------------------
 # Tkinter GUI
 # -------------------------
+# Result cell colours by attended fraction: < 0.4, < 0.7, < 0.9, >= 0.9
+FRACTION_THRESHOLDS = [0.4, 0.7, 0.9]
+FRACTION_BG = ("#fecaca", "#fed7aa", "#fef3c7", "#d1fae5")
+FRACTION_FG = ("#7f1d1d", "#7c2d12", "#78350f", "#065f46")
+
+
+def results_view(res, timetable, desired_attendance_percent):
+    """
+    Everything the results window shows for one solve, as plain data: the summary
+    lines, a (text, info, bold, bg, fg) tuple per timetable cell, and the instructor
+    stats rows. Makes no Tk calls, so it is built in the solver thread.
+    """
+    summary = [
+        f"Total Classes/Week: {res['totalClassesWeek']}",
+        f"Total Classes/Semester: {res['totalClassesSemester']}",
+        f"Required ({desired_attendance_percent}%): {res['requiredClassesWeek']}/week",
+        f"Attending (week fractional): {res['totalFractionalClassesWeek']}/week",
+        f"Total Attending (semester): {res['totalSelectedSemester']}",
+        f"Attendance % (semester): {res['attendancePercentage']}%",
+        f"Avg APS: {res['avgValue']}",
+    ]
+
+    attendance_fractions = res["attendance_fractions"]
+    # simple color gradient logic: bucket every fraction in one np.digitize call
+    fractions = [v["fraction"] for v in attendance_fractions.values()]
+    buckets = dict(zip(attendance_fractions, np.digitize(fractions, FRACTION_THRESHOLDS).tolist()))
+    cells = {}
+    for key, cls in timetable.items():
+        # FINAL OUTPUT: show Instructor number only, no professor name
+        txt = f"{cls['subject']}\nInstructor {cls['instructorId']}"
+        if key in attendance_fractions:
+            fraction = attendance_fractions[key]["fraction"]
+            aps = attendance_fractions[key]["aps"]
+            cells[key] = (txt, f"Attend: {int(fraction*100)}% (APS: {aps})", True,
+                          FRACTION_BG[buckets[key]], FRACTION_FG[buckets[key]])
+        else:
+            cells[key] = (txt, "Not selected (0%)", False, "#f3f4f6", "#6b7280")
+
+    # FINAL OUTPUT: use "Instructor <id>" as the label (no professor names)
+    stats_rows = []
+    for iid, stats in res["instructorStats"].items():
+        total = stats["total"]
+        attended = stats["attended"]
+        percent = round((attended / total * 100), 1) if total > 0 else 0.0
+        stats_rows.append((f"Instructor {iid}",
+                           (f"{attended:.2f}/{total}", f"{attended*20:.1f}/{total*20}", f"{percent}%")))
+    return summary, cells, stats_rows
+
+
+def _optimize_with_view(timetable, student_profile, priorities, desired_attendance_percent):
+    res = optimize_attendance_simplex(timetable, student_profile, priorities, desired_attendance_percent)
+    if res is None:
+        return None, None
+    return res, results_view(res, timetable, desired_attendance_percent)
+
 class AttendanceApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -214,7 +359,7 @@ class AttendanceApp(tk.Tk):
         # default student profile
         self.student_profile = {"travelTime": 2.0, "timeCommitment": 0.5}
 
-        # timetable: keys like "Monday-1" -> { day, slotId, instructorId, subject }
+        # timetable: (day, slot id) keys like ("Monday", 1) -> { day, slotId, instructorId, subject }
         self.timetable = {}
 
         # priorities: instructor_id -> priority_level_string
@@ -225,7 +370,18 @@ class AttendanceApp(tk.Tk):
         self.desired_attendance_percent = tk.DoubleVar(value=75.0)
 
         self.optimized = None
+        # inputs self.optimized was solved from, and its prepared results_view
+        self._optimized_inputs = None
+        self._optimized_view = None
+        self._results_win = None
+        self._scroll_after_id = None
+        # single worker so optimize requests are solved one at a time, off the Tk thread
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # build the whole window hidden so the grid is laid out once on show
+        self.withdraw()
         self._build_ui()
+        self.update_idletasks()
+        self.deiconify()
 
     def _build_ui(self):
         # Top frame
@@ -264,7 +420,8 @@ class AttendanceApp(tk.Tk):
         # Action buttons
         btn_frame = ttk.Frame(top)
         btn_frame.pack(side=tk.RIGHT, padx=6)
-        ttk.Button(btn_frame, text="Optimize (Fractional)", command=self._optimize_click).grid(row=0, column=0, padx=6, pady=4)
+        self.optimize_btn = ttk.Button(btn_frame, text="Optimize (Fractional)", command=self._optimize_click)
+        self.optimize_btn.grid(row=0, column=0, padx=6, pady=4)
         ttk.Button(btn_frame, text="Clear Timetable", command=self._clear_timetable).grid(row=0, column=1, padx=6, pady=4)
         ttk.Button(btn_frame, text="Show Instructors", command=self._show_instructors).grid(row=0, column=2, padx=6, pady=4)
 
@@ -314,7 +471,7 @@ class AttendanceApp(tk.Tk):
         self.canvas.configure(yscrollcommand=vscroll.set)
         self.table_frame = ttk.Frame(self.canvas)
         self.canvas.create_window((0, 0), window=self.table_frame, anchor='nw')
-        self.table_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        self.table_frame.bind("<Configure>", self._schedule_scrollregion)
 
         # Build headers and empty cells
         ttk.Label(self.table_frame, text="Time", relief=tk.RIDGE, width=18).grid(row=0, column=0, sticky="nsew")
@@ -327,9 +484,9 @@ class AttendanceApp(tk.Tk):
                 cell = ttk.Frame(self.table_frame, relief=tk.GROOVE, borderwidth=1, width=220, height=42)
                 cell.grid_propagate(False)
                 cell.grid(row=r, column=c, sticky="nsew", padx=2, pady=2)
-                lbl = ttk.Label(cell, text="(empty)", anchor=tk.CENTER)
+                lbl = ttk.Label(cell, text="(empty)", anchor=tk.CENTER, justify=tk.CENTER)
                 lbl.pack(expand=True, fill=tk.BOTH)
-                key = f"{day}-{slot['id']}"
+                key = (day, slot["id"])
                 self.cell_widgets[key] = (cell, lbl)
                 lbl.bind("<Button-1>", lambda e, k=key: self._cell_clicked(k))
 
@@ -339,6 +496,16 @@ class AttendanceApp(tk.Tk):
         self.total_label = ttk.Label(bottom, text="Total Classes: 0 per week × 20 weeks = 0")
         self.total_label.pack(side=tk.LEFT, padx=6)
 
+    def _schedule_scrollregion(self, event=None):
+        # Coalesce the burst of <Configure> events from grid changes into one bbox update
+        if self._scroll_after_id is not None:
+            self.after_cancel(self._scroll_after_id)
+        self._scroll_after_id = self.after(50, self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        self._scroll_after_id = None
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
     def _on_profile_change(self, event=None):
         try:
             travel_val = float(self.travel_cb.get().split("|")[1])
@@ -355,7 +522,7 @@ class AttendanceApp(tk.Tk):
         prof_text = self.prof_cb.get()
         prof_id = int(prof_text.split(".")[0])
         subject = self.subject_entry.get().strip() or "(no subject)"
-        key = f"{day}-{slot_id}"
+        key = (day, slot_id)
         if key in self.timetable:
             if not messagebox.askyesno("Overwrite?", f"A class already exists at {day} {slot_text}. Overwrite?"):
                 return
@@ -366,31 +533,21 @@ class AttendanceApp(tk.Tk):
 
     def _cell_clicked(self, key):
         if key in self.timetable:
-            if messagebox.askyesno("Remove class", f"Remove class at {key.replace('-', ' slot ')}?"):
+            if messagebox.askyesno("Remove class", f"Remove class at {key[0]} slot {key[1]}?"):
                 del self.timetable[key]
                 self._update_cell_ui(key)
                 self._update_total_label()
 
     def _update_cell_ui(self, key):
-        cell, _ = self.cell_widgets[key]
-        for widget in cell.winfo_children():
-            widget.destroy()
+        _, lbl = self.cell_widgets[key]
         if key in self.timetable:
             cls = self.timetable[key]
             prof = find_professor(cls["instructorId"])
             # Keep professor names visible in the main timetable (editable UI)
             text = f"{cls['subject']}\n{prof['name'] if prof else f'Instructor #{cls['instructorId']}'}"
-            lbl2 = ttk.Label(cell, text=text, anchor=tk.CENTER, justify=tk.CENTER)
-            lbl2.pack(expand=True, fill=tk.BOTH)
-            lbl2.bind("<Button-1>", lambda e, k=key: self._cell_clicked(k))
-            lbl2.configure(background="#e8f4ff")
-            cell.configure(width=220, height=42)
+            lbl.configure(text=text, background="#e8f4ff")
         else:
-            lbl2 = ttk.Label(cell, text="(empty)", anchor=tk.CENTER)
-            lbl2.pack(expand=True, fill=tk.BOTH)
-            lbl2.bind("<Button-1>", lambda e, k=key: self._cell_clicked(k))
-            lbl2.configure(background="#ffffff")
-            cell.configure(width=220, height=42)
+            lbl.configure(text="(empty)", background="#ffffff")
 
     def _update_total_label(self):
         total = len(self.timetable)
@@ -398,19 +555,18 @@ class AttendanceApp(tk.Tk):
 
     def _clear_timetable(self):
         if messagebox.askyesno("Clear", "Clear the entire timetable?"):
+            # Only populated cells change; empty ones already show "(empty)"
+            changed = list(self.timetable)
             self.timetable.clear()
-            for k in list(self.cell_widgets.keys()):
+            for k in changed:
                 self._update_cell_ui(k)
             self._update_total_label()
             self.optimized = None
             messagebox.showinfo("Cleared", "Timetable cleared.")
 
     def _show_instructors(self):
-        lines = []
-        for p in PROFESSORS:
-            level = self.priorities.get(p["id"], "Medium")
-            lines.append(f"#{p['id']} - {p['name']}  (Priority: {level})")
-        messagebox.showinfo("Instructors", "\n".join(lines))
+        text = "\n".join(label + self.priorities.get(pid, "Medium") + ")" for pid, label in INSTRUCTOR_LABELS)
+        messagebox.showinfo("Instructors", text)
 
     def _open_priorities_window(self):
         # Option 1 layout (compact scrolling list)
@@ -468,28 +624,54 @@ class AttendanceApp(tk.Tk):
             messagebox.showerror("Invalid input", "Enter desired attendance percent between 0 and 100.")
             return
 
-        result = optimize_attendance_simplex(self.timetable, self.student_profile, self.priorities, dval)
+        # Nothing changed since the last solve (e.g. reopening the results): show it again
+        inputs = (tuple((k, v["instructorId"], v["subject"]) for k, v in self.timetable.items()),
+                  tuple(sorted(self.priorities.items())),
+                  self.student_profile["travelTime"], self.student_profile["timeCommitment"], dval)
+        if self.optimized is not None and inputs == self._optimized_inputs:
+            self._show_optimization_result(self._optimized_view)
+            return
+
+        # Solve and lay out the results on a snapshot in the worker thread and poll for
+        # them, so the UI stays live and only applies the finished view
+        fut = self._pool.submit(_optimize_with_view, dict(self.timetable), dict(self.student_profile),
+                                dict(self.priorities), dval)
+        self.optimize_btn.state(["disabled"])
+        self.after(50, self._poll_result, fut, inputs)
+
+    def _poll_result(self, fut, inputs):
+        if not fut.done():
+            self.after(50, self._poll_result, fut, inputs)
+            return
+        self.optimize_btn.state(["!disabled"])
+        try:
+            result, view = fut.result()
+        except Exception as e:
+            messagebox.showerror("Optimization failed", str(e))
+            return
         if result is None:
             messagebox.showinfo("No solution", "Could not find optimal solution for the given constraints.")
             return
         self.optimized = result
-        self._show_optimization_result(result)
+        self._optimized_inputs = inputs
+        self._optimized_view = view
+        self._show_optimization_result(view)
 
-    def _show_optimization_result(self, res):
+    def _build_results_window(self):
         win = tk.Toplevel(self)
+        win.withdraw()
         win.title("Optimization Results - Fractional Attendance")
         win.geometry("1000x700")
+        # Closing only hides the window so the next optimize can reuse its widgets
+        win.protocol("WM_DELETE_WINDOW", win.withdraw)
 
         top_frame = ttk.Frame(win)
         top_frame.pack(fill=tk.X, padx=8, pady=8)
-
-        ttk.Label(top_frame, text=f"Total Classes/Week: {res['totalClassesWeek']}", width=30).grid(row=0, column=0, padx=6)
-        ttk.Label(top_frame, text=f"Total Classes/Semester: {res['totalClassesSemester']}", width=30).grid(row=0, column=1, padx=6)
-        ttk.Label(top_frame, text=f"Required ({self.desired_attendance_percent.get()}%): {res['requiredClassesWeek']}/week", width=30).grid(row=0, column=2, padx=6)
-        ttk.Label(top_frame, text=f"Attending (week fractional): {res['totalFractionalClassesWeek']}/week", width=30).grid(row=1, column=0, padx=6)
-        ttk.Label(top_frame, text=f"Total Attending (semester): {res['totalSelectedSemester']}", width=30).grid(row=1, column=1, padx=6)
-        ttk.Label(top_frame, text=f"Attendance % (semester): {res['attendancePercentage']}%", width=30).grid(row=1, column=2, padx=6)
-        ttk.Label(top_frame, text=f"Avg APS: {res['avgValue']}", width=30).grid(row=2, column=1, padx=6)
+        self._results_summary = []
+        for row, col in [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2), (2, 1)]:
+            lbl = ttk.Label(top_frame, width=30)
+            lbl.grid(row=row, column=col, padx=6)
+            self._results_summary.append(lbl)
 
         # Weekly pattern with fractions
         table_frame = ttk.Frame(win)
@@ -499,48 +681,19 @@ class AttendanceApp(tk.Tk):
         for c, day in enumerate(DAYS, start=1):
             ttk.Label(table_frame, text=day, relief=tk.RIDGE, width=28).grid(row=0, column=c, sticky="nsew")
 
-        attendance_fractions = res["attendance_fractions"]
+        self._results_cells = {}
         for r, slot in enumerate(TIME_SLOTS, start=1):
             ttk.Label(table_frame, text=slot["time"], relief=tk.RIDGE, width=16).grid(row=r, column=0, sticky="nsew")
             for c, day in enumerate(DAYS, start=1):
-                key = f"{day}-{slot['id']}"
                 frame = ttk.Frame(table_frame, relief=tk.GROOVE, borderwidth=1, width=220, height=60)
                 frame.grid_propagate(False)
                 frame.grid(row=r, column=c, sticky="nsew", padx=2, pady=2)
-
-                if key in self.timetable:
-                    cls = self.timetable[key]
-                    # FINAL OUTPUT: show Instructor number only, no professor name
-                    txt = f"{cls['subject']}\nInstructor {cls['instructorId']}"
-                    if key in attendance_fractions:
-                        fraction = attendance_fractions[key]["fraction"]
-                        aps = attendance_fractions[key]["aps"]
-                        # simple color gradient logic
-                        if fraction >= 0.9:
-                            bg_color = "#d1fae5"
-                            fg_color = "#065f46"
-                        elif fraction >= 0.7:
-                            bg_color = "#fef3c7"
-                            fg_color = "#78350f"
-                        elif fraction >= 0.4:
-                            bg_color = "#fed7aa"
-                            fg_color = "#7c2d12"
-                        else:
-                            bg_color = "#fecaca"
-                            fg_color = "#7f1d1d"
-                        lbl = tk.Label(frame, text=txt, anchor=tk.CENTER, justify=tk.CENTER,
-                                       bg=bg_color, fg=fg_color)
-                        lbl.pack(expand=True, fill=tk.BOTH)
-                        info_lbl = tk.Label(frame, text=f"Attend: {int(fraction*100)}% (APS: {aps})",
-                                            font=("TkDefaultFont", 8, "bold"),
-                                            bg=bg_color, fg=fg_color)
-                        info_lbl.pack()
-                    else:
-                        lbl = tk.Label(frame, text=txt, anchor=tk.CENTER, justify=tk.CENTER, bg="#f3f4f6", fg="#6b7280")
-                        lbl.pack(expand=True, fill=tk.BOTH)
-                        tk.Label(frame, text="Not selected (0%)", font=("TkDefaultFont", 8), bg="#f3f4f6", fg="#6b7280").pack()
-                else:
-                    ttk.Label(frame, text="").pack()
+                lbl = tk.Label(frame, anchor=tk.CENTER, justify=tk.CENTER)
+                lbl.pack(expand=True, fill=tk.BOTH)
+                info_lbl = tk.Label(frame)
+                info_lbl.pack()
+                self._results_cells[(day, slot["id"])] = (frame, lbl, info_lbl)
+        self._results_default_colors = (lbl.cget("bg"), lbl.cget("fg"))
 
         # Instructor stats
         stats_frame = ttk.LabelFrame(win, text="Instructor-wise Fractional Attendance")
@@ -555,21 +708,41 @@ class AttendanceApp(tk.Tk):
         tree.column("semester_frac", width=150, anchor=tk.CENTER)
         tree.column("percent", width=120, anchor=tk.CENTER)
         tree.pack(fill=tk.BOTH, expand=True)
-
-        # FINAL OUTPUT: use "Instructor <id>" as the label (no professor names)
-        for iid, stats in res["instructorStats"].items():
-            total = stats["total"]
-            attended = stats["attended"]
-            percent = round((attended / total * 100), 1) if total > 0 else 0.0
-            tree.insert("", "end", text=f"Instructor {iid}",
-                        values=(f"{attended:.2f}/{total}",
-                                f"{attended*20:.1f}/{total*20}",
-                                f"{percent}%"))
+        self._results_tree = tree
 
         ttk.Label(win, text="Note: Fractional attendance means attending that fraction of occurrences.\n"
                              "E.g., 0.75 = attend 15 out of 20 lectures for that slot.",
                   font=("TkDefaultFont", 9, "italic")).pack(pady=4)
-        ttk.Button(win, text="Close", command=win.destroy).pack(pady=6)
+        ttk.Button(win, text="Close", command=win.withdraw).pack(pady=6)
+        self._results_win = win
+
+    def _show_optimization_result(self, view):
+        # view comes from results_view, so this only pushes its values into the widgets
+        summary, cells, stats_rows = view
+        # Build the results window once, then only re-config its widgets
+        if self._results_win is None or not self._results_win.winfo_exists():
+            self._build_results_window()
+        win = self._results_win
+
+        for lbl, text in zip(self._results_summary, summary):
+            lbl.configure(text=text)
+
+        default_bg, default_fg = self._results_default_colors
+        for key, (frame, lbl, info_lbl) in self._results_cells.items():
+            # cells only holds the solved timetable's slots; the rest are shown empty
+            txt, info, bold, bg_color, fg_color = cells.get(key, ("", "", False, default_bg, default_fg))
+            info_font = ("TkDefaultFont", 8, "bold") if bold else ("TkDefaultFont", 8)
+            lbl.configure(text=txt, bg=bg_color, fg=fg_color)
+            info_lbl.configure(text=info, font=info_font, bg=bg_color, fg=fg_color)
+
+        tree = self._results_tree
+        tree.delete(*tree.get_children())
+        for text, values in stats_rows:
+            tree.insert("", "end", text=text, values=values)
+
+        win.update_idletasks()
+        win.deiconify()
+        win.lift()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,35 @@
+import hashlib
+import inspect
+import os
+import sys
+
 import pandas as pd
 import numpy as np
+import matplotlib
+
+# Redirected runs only save the correlation and weight charts to disk, so use
+# the non-GUI Agg backend and never block on plt.show()
+INTERACTIVE = sys.stdout.isatty()
+if not INTERACTIVE:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import seaborn as sns
 
-# Read the CSV file
+# load_factor_scores parses the CSV only on a cache miss: with pyarrow when it is
+# installed, otherwise pandas' C engine
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# CSV file (parsed once, in the main execution block)
 file_path = '/Users/debasmibasu/Documents/maths - lpp/Attendance_Optimization_bootstrapped_60.csv'
-df = pd.read_csv(file_path)
+
+# Factor scores derived from the CSV are cached here, stamped with the CSV's path
+# and modification time and a hash of the scoring setup, until either changes
+cache_file = 'factor_scores_cache.npz'
 
 # Define the 8 key factors based on your survey:
 # 1. Perceived Value/Learning
@@ -17,108 +41,211 @@ df = pd.read_csv(file_path)
 # 7. Travel Time (from initial questions)
 # 8. Time Commitments (from initial questions)
 
+# Rating factors (1-6) and the substring that marks their survey columns
+RATING_FACTOR_PATTERNS = [
+    ('Perceived_Value', 'Perceived value'),
+    ('Liking_Engagement', 'Liking & Engagement'),
+    ('Study_Efficiency', 'Study Time Efficiency'),
+    ('Attendance_Risk', 'Attendance Risk'),
+    ('Time_Block_Pref', 'Time Block'),
+    ('Holiday_Skip', 'Holiday Skip'),
+]
+
+# Factor 7: travel time answers in increasing order, scored 1-5
+TRAVEL_TIME_COLUMN = 'What is your typical ONE-WAY travel time to college on an average day?'
+TRAVEL_TIME_ORDER = [
+    'Under 15 minutes',
+    '15 - 30 minutes',
+    '30 - 60 minutes',
+    '60 to 90 minutes',
+    'over 90 minutes'
+]
+
+# Factor 8: time commitments, found by a header keyword; each answer scores the
+# value of the first category pattern it contains
+COMMITMENT_KEYWORD = 'major time commitments'
+COMMITMENT_CATEGORIES = [
+    (r'only major commitment|no,', 0.0),
+    (r'society|club|sports', 0.5),
+    (r'part-time|internship|job', 1.0),
+    (r'family|personal', 1.5),
+]
+
 # Example: Creating aggregate scores per student per professor
 # You'll need to adapt this to your actual data structure
 
-def calculate_correlation_matrix(df):
+def calculate_factor_scores(df):
     """
-    Calculate correlation matrix for the 8 attendance factors
+    Calculate each response's score on the 8 attendance factors
     
     Parameters:
     df: DataFrame with all survey responses
     
     Returns:
-    correlation_matrix: DataFrame with correlations between factors
+    factor_scores: DataFrame with one column per factor, NaN for missing scores
+    commitment_report: text describing how the Time Commitments column was found
+                       and mapped, for the caller to print
     """
     
+    report = []
+    
     # Calculate average scores across all professors for each factor
     factor_scores = pd.DataFrame()
     
-    # Factor 1: Perceived Value/Learning
-    perceived_value_cols = [col for col in df.columns if 'Perceived value' in col]
-    if perceived_value_cols:
-        factor_scores['Perceived_Value'] = df[perceived_value_cols].apply(pd.to_numeric, errors='coerce').mean(axis=1)
-    
-    # Factor 2: Liking & Engagement
-    engagement_cols = [col for col in df.columns if 'Liking & Engagement' in col]
-    if engagement_cols:
-        factor_scores['Liking_Engagement'] = df[engagement_cols].apply(pd.to_numeric, errors='coerce').mean(axis=1)
-    
-    # Factor 3: Study Time Efficiency
-    efficiency_cols = [col for col in df.columns if 'Study Time Efficiency' in col]
-    if efficiency_cols:
-        factor_scores['Study_Efficiency'] = df[efficiency_cols].apply(pd.to_numeric, errors='coerce').mean(axis=1)
-    
-    # Factor 4: Attendance Risk
-    risk_cols = [col for col in df.columns if 'Attendance Risk' in col]
-    if risk_cols:
-        factor_scores['Attendance_Risk'] = df[risk_cols].apply(pd.to_numeric, errors='coerce').mean(axis=1)
-    
-    # Factor 5: Time Block Preference (convert to numeric: higher = prefer later times)
-    time_block_cols = [col for col in df.columns if 'Time Block' in col]
-    if time_block_cols:
-        factor_scores['Time_Block_Pref'] = df[time_block_cols].apply(pd.to_numeric, errors='coerce').mean(axis=1)
-    
-    # Factor 6: Holiday Skip Likelihood
-    holiday_cols = [col for col in df.columns if 'Holiday Skip' in col]
-    if holiday_cols:
-        factor_scores['Holiday_Skip'] = df[holiday_cols].apply(pd.to_numeric, errors='coerce').mean(axis=1)
+    # Factors 1-6 average a group of per-professor rating columns:
+    # 1. Perceived Value/Learning, 2. Liking & Engagement, 3. Study Time Efficiency,
+    # 4. Attendance Risk, 5. Time Block Preference (higher = prefer later times),
+    # 6. Holiday Skip Likelihood
+    # One walk over the columns sorts each into the factors whose pattern it contains
+    rating_factors = [(name, []) for name, _ in RATING_FACTOR_PATTERNS]
+    for col in df.columns:
+        for (_, pattern), (_, cols) in zip(RATING_FACTOR_PATTERNS, rating_factors):
+            if pattern in col:
+                cols.append(col)
+    
+    # Coerce every rating column to numbers in one pass, then average each group's
+    # columns of the shared matrix (NaN-skipping, like DataFrame.mean)
+    rating_cols = list(dict.fromkeys(col for _, cols in rating_factors for col in cols))
+    ratings = df[rating_cols].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+    position = {col: j for j, col in enumerate(rating_cols)}
+    for name, cols in rating_factors:
+        if cols:
+            block = ratings[:, [position[col] for col in cols]]
+            answered = ~np.isnan(block)
+            with np.errstate(invalid='ignore'):
+                factor_scores[name] = (np.where(answered, block, 0.0).sum(axis=1)
+                                       / answered.sum(axis=1))
     
     # Factor 7: Travel Time (convert categorical to numeric)
-    travel_col = 'What is your typical ONE-WAY travel time to college on an average day?'
+    travel_col = TRAVEL_TIME_COLUMN
     if travel_col in df.columns:
-        travel_mapping = {
-            'Under 15 minutes': 1,
-            '15 - 30 minutes': 2,
-            '30 - 60 minutes': 3,
-            '60 to 90 minutes': 4,
-            'over 90 minutes': 5
-        }
-        factor_scores['Travel_Time'] = df[travel_col].map(travel_mapping)
+        # Answers are scored 1-5 by their category code
+        travel_codes = pd.Categorical(df[travel_col], categories=TRAVEL_TIME_ORDER).codes
+        # code -1 is a missing or unlisted answer
+        factor_scores['Travel_Time'] = np.where(travel_codes >= 0, travel_codes + 1.0, np.nan)
     
     # Factor 8: Time Commitments (convert categorical to numeric using the formula from image)
     # TT = 0 (only college), 0.5 (college + society/clubs), 1 (college + part-time), 1.5 (college + family issues)
     commitment_col = None
     for col in df.columns:
-        if 'major time commitments' in col.lower():
+        if COMMITMENT_KEYWORD in col.lower():
             commitment_col = col
             break
     
     if commitment_col is not None:
-        print(f"\nFound Time Commitments column: {commitment_col}")
-        print(f"Unique values in column:")
-        print(df[commitment_col].value_counts())
-        
-        # Create mapping with partial string matching
-        def map_commitment(value):
-            if pd.isna(value):
-                return np.nan
-            value_str = str(value).lower()
-            if 'only major commitment' in value_str or 'no,' in value_str:
-                return 0.0
-            elif 'society' in value_str or 'club' in value_str or 'sports' in value_str:
-                return 0.5
-            elif 'part-time' in value_str or 'internship' in value_str or 'job' in value_str:
-                return 1.0
-            elif 'family' in value_str or 'personal' in value_str:
-                return 1.5
-            else:
-                return np.nan
+        report.append(f"\nFound Time Commitments column: {commitment_col}")
+        report.append(f"Unique values in column:")
+        report.append(str(df[commitment_col].value_counts()))
         
-        factor_scores['Time_Commitments'] = df[commitment_col].apply(map_commitment)
-        print(f"Time Commitments mapped: {factor_scores['Time_Commitments'].notna().sum()} values")
-        print(f"Distribution: \n{factor_scores['Time_Commitments'].value_counts().sort_index()}")
+        # Create mapping with partial string matching, as one vectorized pass per
+        # category; np.select takes the first matching category, like an if/elif chain
+        answers = df[commitment_col].astype('string').str.lower()
+        masks = [answers.str.contains(pattern, regex=True, na=False).to_numpy(dtype=bool)
+                 for pattern, _ in COMMITMENT_CATEGORIES]
+        factor_scores['Time_Commitments'] = np.select(masks, [value for _, value in COMMITMENT_CATEGORIES],
+                                                      default=np.nan)
+        report.append(f"Time Commitments mapped: {factor_scores['Time_Commitments'].notna().sum()} values")
+        report.append(f"Distribution: \n{factor_scores['Time_Commitments'].value_counts().sort_index()}")
     else:
-        print(f"WARNING: Could not find column for Time Commitments")
-        print(f"Available columns: {df.columns.tolist()[:10]}")
+        report.append(f"WARNING: Could not find column for Time Commitments")
+        report.append(f"Available columns: {df.columns.tolist()[:10]}")
     
     # Remove any rows with all NaN values
     factor_scores = factor_scores.dropna(how='all')
     
-    # Calculate correlation matrix
-    correlation_matrix = factor_scores.corr()
+    return factor_scores, "\n".join(report)
+
+
+def calculate_correlation_matrix(factor_scores, commitment_report):
+    """
+    Calculate correlation matrix for the 8 attendance factors
     
-    return correlation_matrix, factor_scores
+    Parameters:
+    factor_scores: DataFrame with the per-response factor scores
+    commitment_report: the Time Commitments report from load_factor_scores, printed
+    here on a cache hit or miss alike so the output reads the same either way
+    
+    Returns:
+    correlation_matrix: DataFrame with correlations between factors
+    """
+    
+    print(commitment_report)
+    return pairwise_correlation(factor_scores)
+
+
+def scoring_config_hash():
+    """
+    Hash of everything that decides the factor scores: the column patterns and
+    answer mappings above plus the source of calculate_factor_scores, so a cache
+    written by a different scoring setup is never reused
+    """
+    config = repr((RATING_FACTOR_PATTERNS, TRAVEL_TIME_COLUMN, TRAVEL_TIME_ORDER,
+                   COMMITMENT_KEYWORD, COMMITMENT_CATEGORIES))
+    return hashlib.sha256((config + inspect.getsource(calculate_factor_scores)).encode()).hexdigest()
+
+
+def load_factor_scores(path, cache_path=cache_file):
+    """
+    Factor scores for the survey CSV, reusing the on-disk cache while the CSV and
+    the scoring setup are unchanged (the CSV is only parsed on a cache miss)
+    
+    Returns:
+    factor_scores: DataFrame with one column per factor, NaN for missing scores
+    commitment_report: the Time Commitments report from calculate_factor_scores
+    shape: shape of the full survey table
+    """
+    
+    mtime = os.path.getmtime(path)
+    config_hash = scoring_config_hash()
+    if os.path.exists(cache_path):
+        with np.load(cache_path) as cache:
+            if (str(cache['source']) == path and float(cache['source_mtime']) == mtime
+                    and 'config_hash' in cache and str(cache['config_hash']) == config_hash):
+                factor_scores = pd.DataFrame(cache['scores'], index=cache['index'],
+                                             columns=cache['columns'].tolist())
+                return factor_scores, str(cache['commitment_report']), tuple(cache['shape'].tolist())
+    
+    df = pd.read_csv(path, engine=CSV_ENGINE)
+    factor_scores, commitment_report = calculate_factor_scores(df)
+    np.savez(cache_path, scores=factor_scores.to_numpy(dtype=np.float64),
+             index=factor_scores.index.to_numpy(), columns=np.array(factor_scores.columns.tolist(), dtype=str),
+             commitment_report=np.array(commitment_report), shape=np.array(df.shape),
+             source=path, source_mtime=mtime, config_hash=config_hash)
+    return factor_scores, commitment_report, df.shape
+
+
+def pairwise_correlation(factor_scores):
+    """
+    Pearson correlation between every pair of factors, like DataFrame.corr(): each
+    pair uses only the responses that answered both, so a missing answer does not
+    drop the whole row. All pairs are computed at once on a (rows x factors x factors)
+    array instead of pandas' pair-by-pair loop
+    
+    Parameters:
+    factor_scores: DataFrame with one column per factor, NaN for missing scores
+    
+    Returns:
+    correlation_matrix: DataFrame with correlations between factors
+    """
+    
+    scores = factor_scores.to_numpy(dtype=np.float64)
+    present = ~np.isnan(scores)
+    both = present[:, :, None] & present[:, None, :]
+    n_both = both.sum(axis=0)
+    
+    # Mean of factor i over the responses that also answered factor j (and vice versa)
+    filled = np.where(present, scores, 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_i = np.einsum('ri,rj->ij', filled, present.astype(np.float64)) / n_both
+        mean_j = mean_i.T
+        
+        dev_i = np.where(both, scores[:, :, None] - mean_i, 0.0)
+        dev_j = np.where(both, scores[:, None, :] - mean_j, 0.0)
+        corr = (dev_i * dev_j).sum(axis=0) / np.sqrt((dev_i * dev_i).sum(axis=0) * (dev_j * dev_j).sum(axis=0))
+    # Fewer than two shared responses give no correlation, as with DataFrame.corr
+    corr[n_both < 2] = np.nan
+    
+    return pd.DataFrame(corr, index=factor_scores.columns, columns=factor_scores.columns)
 
 
 def normalize_correlation_matrix(correlation_matrix):
@@ -134,32 +261,53 @@ def normalize_correlation_matrix(correlation_matrix):
     weights: Series with factor weights (row averages)
     """
     
+    # Work on one array copy in place; labels are attached again only on return
+    labels = correlation_matrix.index
+    normalized = correlation_matrix.to_numpy(dtype=np.float64, copy=True)
+    
     # Take absolute values for normalization (since correlations can be negative)
-    abs_corr_matrix = correlation_matrix.abs()
+    np.abs(normalized, out=normalized)
     
     # Normalize: divide each entry by its column sum
-    column_sums = abs_corr_matrix.sum(axis=0)
-    normalized_matrix = abs_corr_matrix / column_sums
+    normalized /= np.nansum(normalized, axis=0)
     
     # Calculate weights as row averages of normalized matrix
-    weights = normalized_matrix.mean(axis=1)
+    weights = np.nanmean(normalized, axis=1)
     
     # Normalize weights to sum to 1 (if needed)
-    weights_normalized = weights / weights.sum()
+    weights_normalized = weights / np.nansum(weights)
     
-    return normalized_matrix, weights, weights_normalized
+    normalized_matrix = pd.DataFrame(normalized, index=labels, columns=correlation_matrix.columns)
+    return normalized_matrix, pd.Series(weights, index=labels), pd.Series(weights_normalized, index=labels)
 
 
-def plot_normalized_matrix(normalized_matrix, save_path='normalized_correlation_matrix.png'):
+def reset_figure(fig, figsize):
+    """
+    Figure for the next weights chart: the heatmap's figure is reused for the
+    normalized matrix and the bar chart unless an interactive plt.show() closed it
+    """
+    
+    if fig is None or not plt.fignum_exists(fig.number):
+        return plt.figure(figsize=figsize)
+    fig.clf()
+    fig.set_size_inches(*figsize)
+    return fig
+
+
+def plot_normalized_matrix(normalized_matrix, save_path='normalized_correlation_matrix.png', fig=None):
     """
     Create a heatmap visualization of the normalized correlation matrix
     
     Parameters:
     normalized_matrix: DataFrame with normalized correlation values
     save_path: Path to save the figure
+    fig: Figure to draw into (cleared first); a new one is created if None
+    
+    Returns:
+    fig: The figure that was drawn
     """
     
-    plt.figure(figsize=(12, 10))
+    fig = reset_figure(fig, (12, 10))
     
     # Create heatmap
     sns.heatmap(normalized_matrix, 
@@ -178,21 +326,28 @@ def plot_normalized_matrix(normalized_matrix, save_path='normalized_correlation_
     plt.yticks(rotation=0)
     plt.tight_layout()
     
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.savefig(save_path, dpi=150, bbox_inches='tight')
     print(f"Normalized correlation matrix saved to {save_path}")
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
+    
+    return fig
 
 
-def plot_weights_bar_chart(weights_normalized, save_path='factor_weights.png'):
+def plot_weights_bar_chart(weights_normalized, save_path='factor_weights.png', fig=None):
     """
     Create a bar chart of factor weights
     
     Parameters:
     weights_normalized: Series with normalized weights
     save_path: Path to save the figure
+    fig: Figure to draw into (cleared first); a new one is created if None
+    
+    Returns:
+    fig: The figure that was drawn
     """
     
-    plt.figure(figsize=(12, 6))
+    fig = reset_figure(fig, (12, 6))
     
     # Create bar chart
     bars = plt.bar(range(len(weights_normalized)), 
@@ -218,133 +373,146 @@ def plot_weights_bar_chart(weights_normalized, save_path='factor_weights.png'):
     plt.grid(axis='y', alpha=0.3, linestyle='--')
     plt.tight_layout()
     
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.savefig(save_path, dpi=150, bbox_inches='tight')
     print(f"Factor weights chart saved to {save_path}")
-    plt.show()
+    if INTERACTIVE:
+        plt.show()
+    
+    return fig
+
+
+def main():
+    """
+    Run the weight analysis on the survey CSV: print the correlation and weight
+    tables and save the three charts
+    """
+    
+    print("Loading data...")
+    factor_scores, commitment_report, data_shape = load_factor_scores(file_path)
+    print(f"Data loaded successfully! Shape: {data_shape}")
+    print(f"Number of responses: {data_shape[0]}")
+
+    # Calculate correlation matrix
+    print("\nCalculating correlation matrix...")
+    correlation_matrix = calculate_correlation_matrix(factor_scores, commitment_report)
+
+    # Debug: Check which factors were successfully calculated
+    print("\n" + "="*60)
+    print("FACTORS INCLUDED IN ANALYSIS:")
+    print("="*60)
+    for col in factor_scores.columns:
+        non_null_count = factor_scores[col].notna().sum()
+        print(f"{col}: {non_null_count} valid responses")
+    print(f"\nTotal factors: {len(factor_scores.columns)}")
+    print(f"Expected: 8 factors")
+
+    # Print original correlation matrix
+    print("\n" + "="*60)
+    print("ORIGINAL CORRELATION MATRIX:")
+    print("="*60)
+    print(correlation_matrix.round(3))
+
+    # Normalize correlation matrix and calculate weights
+    print("\nNormalizing correlation matrix and calculating weights...")
+    normalized_matrix, weights, weights_normalized = normalize_correlation_matrix(correlation_matrix)
+
+    # Print normalized matrix
+    print("\n" + "="*60)
+    print("NORMALIZED CORRELATION MATRIX:")
+    print("(Each entry divided by column sum)")
+    print("="*60)
+    print(normalized_matrix.round(4))
+
+    # Print column sums to verify normalization
+    print("\n" + "="*60)
+    print("COLUMN SUMS (should all be 1.0):")
+    print("="*60)
+    print(normalized_matrix.sum(axis=0).round(4))
+
+    # Print weights
+    print("\n" + "="*60)
+    print("FACTOR WEIGHTS (Row Averages):")
+    print("="*60)
+    weights_df = pd.DataFrame({
+        'Factor': weights.index,
+        'Weight (Raw)': weights.values,
+        'Weight (Normalized)': weights_normalized.values,
+        'Weight (%)': (weights_normalized.values * 100)
+    })
+    print(weights_df.to_string(index=False))
+
+    # Print ranked weights
+    print("\n" + "="*60)
+    print("FACTORS RANKED BY IMPORTANCE:")
+    print("="*60)
+    weights_ranked = weights_df.sort_values('Weight (Normalized)', ascending=False)
+    for idx, row in weights_ranked.iterrows():
+        print(f"{row['Factor']:.<30} {row['Weight (%)']:.2f}%")
+
+    # Plot original correlation matrix
+    print("\nGenerating visualizations...")
+    # One figure is cleared and reused for all three plots
+    fig = reset_figure(None, (12, 10))
+    sns.heatmap(correlation_matrix, 
+                annot=True,
+                fmt='.3f',
+                cmap='RdYlGn',
+                center=0,
+                square=True,
+                linewidths=1,
+                cbar_kws={"shrink": 0.8},
+                vmin=-1, vmax=1)
+    plt.title('Original Correlation Matrix: Attendance Optimization Factors', 
+              fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Factors', fontsize=12, fontweight='bold')
+    plt.ylabel('Factors', fontsize=12, fontweight='bold')
+    plt.xticks(rotation=45, ha='right')
+    plt.yticks(rotation=0)
+    plt.tight_layout()
+    plt.savefig('correlation_matrix.png', dpi=150, bbox_inches='tight')
+    print("Original correlation matrix saved to 'correlation_matrix.png'")
+    if INTERACTIVE:
+        plt.show()
+
+    # Plot normalized matrix
+    fig = plot_normalized_matrix(normalized_matrix, fig=fig)
+
+    # Plot weights
+    fig = plot_weights_bar_chart(weights_normalized, fig=fig)
+
+    # Summary statistics
+    print("\n" + "="*60)
+    print("FACTOR SCORE STATISTICS:")
+    print("="*60)
+    print(factor_scores.describe().round(2))
+
+    # Identify strongest correlations in original matrix
+    print("\n" + "="*60)
+    print("STRONGEST CORRELATIONS (Original Matrix):")
+    print("="*60)
+    # Every pair above the diagonal, in row-major order, gathered in one fancy index
+    factor_names = correlation_matrix.columns.to_numpy()
+    upper_i, upper_j = np.triu_indices(len(factor_names), k=1)
+    corr_df = pd.DataFrame({
+        'Factor 1': factor_names[upper_i],
+        'Factor 2': factor_names[upper_j],
+        'Correlation': correlation_matrix.to_numpy()[upper_i, upper_j]
+    })
+    corr_df = corr_df.sort_values('Correlation', ascending=False)
+    print("\nTop 5 Positive Correlations:")
+    print(corr_df.head(5).to_string(index=False))
+    print("\nTop 5 Negative Correlations:")
+    print(corr_df.tail(5).to_string(index=False))
+
+    print("\n" + "="*60)
+    print("Analysis complete!")
+    print("Generated files:")
+    print("  - correlation_matrix.png (original)")
+    print("  - normalized_correlation_matrix.png")
+    print("  - factor_weights.png")
+    print("="*60)
 
 
 # MAIN EXECUTION
-print("Loading data...")
-df = pd.read_csv(file_path)
-print(f"Data loaded successfully! Shape: {df.shape}")
-print(f"Number of responses: {len(df)}")
-
-# Calculate correlation matrix
-print("\nCalculating correlation matrix...")
-correlation_matrix, factor_scores = calculate_correlation_matrix(df)
-
-# Debug: Check which factors were successfully calculated
-print("\n" + "="*60)
-print("FACTORS INCLUDED IN ANALYSIS:")
-print("="*60)
-for col in factor_scores.columns:
-    non_null_count = factor_scores[col].notna().sum()
-    print(f"{col}: {non_null_count} valid responses")
-print(f"\nTotal factors: {len(factor_scores.columns)}")
-print(f"Expected: 8 factors")
-
-# Print original correlation matrix
-print("\n" + "="*60)
-print("ORIGINAL CORRELATION MATRIX:")
-print("="*60)
-print(correlation_matrix.round(3))
-
-# Normalize correlation matrix and calculate weights
-print("\nNormalizing correlation matrix and calculating weights...")
-normalized_matrix, weights, weights_normalized = normalize_correlation_matrix(correlation_matrix)
-
-# Print normalized matrix
-print("\n" + "="*60)
-print("NORMALIZED CORRELATION MATRIX:")
-print("(Each entry divided by column sum)")
-print("="*60)
-print(normalized_matrix.round(4))
-
-# Print column sums to verify normalization
-print("\n" + "="*60)
-print("COLUMN SUMS (should all be 1.0):")
-print("="*60)
-print(normalized_matrix.sum(axis=0).round(4))
-
-# Print weights
-print("\n" + "="*60)
-print("FACTOR WEIGHTS (Row Averages):")
-print("="*60)
-weights_df = pd.DataFrame({
-    'Factor': weights.index,
-    'Weight (Raw)': weights.values,
-    'Weight (Normalized)': weights_normalized.values,
-    'Weight (%)': (weights_normalized.values * 100)
-})
-print(weights_df.to_string(index=False))
-
-# Print ranked weights
-print("\n" + "="*60)
-print("FACTORS RANKED BY IMPORTANCE:")
-print("="*60)
-weights_ranked = weights_df.sort_values('Weight (Normalized)', ascending=False)
-for idx, row in weights_ranked.iterrows():
-    print(f"{row['Factor']:.<30} {row['Weight (%)']:.2f}%")
-
-# Plot original correlation matrix
-print("\nGenerating visualizations...")
-plt.figure(figsize=(12, 10))
-sns.heatmap(correlation_matrix, 
-            annot=True,
-            fmt='.3f',
-            cmap='RdYlGn',
-            center=0,
-            square=True,
-            linewidths=1,
-            cbar_kws={"shrink": 0.8},
-            vmin=-1, vmax=1)
-plt.title('Original Correlation Matrix: Attendance Optimization Factors', 
-          fontsize=16, fontweight='bold', pad=20)
-plt.xlabel('Factors', fontsize=12, fontweight='bold')
-plt.ylabel('Factors', fontsize=12, fontweight='bold')
-plt.xticks(rotation=45, ha='right')
-plt.yticks(rotation=0)
-plt.tight_layout()
-plt.savefig('correlation_matrix.png', dpi=300, bbox_inches='tight')
-print("Original correlation matrix saved to 'correlation_matrix.png'")
-plt.show()
-
-# Plot normalized matrix
-plot_normalized_matrix(normalized_matrix)
-
-# Plot weights
-plot_weights_bar_chart(weights_normalized)
-
-# Summary statistics
-print("\n" + "="*60)
-print("FACTOR SCORE STATISTICS:")
-print("="*60)
-print(factor_scores.describe().round(2))
-
-# Identify strongest correlations in original matrix
-print("\n" + "="*60)
-print("STRONGEST CORRELATIONS (Original Matrix):")
-print("="*60)
-corr_pairs = []
-for i in range(len(correlation_matrix.columns)):
-    for j in range(i+1, len(correlation_matrix.columns)):
-        corr_pairs.append({
-            'Factor 1': correlation_matrix.columns[i],
-            'Factor 2': correlation_matrix.columns[j],
-            'Correlation': correlation_matrix.iloc[i, j]
-        })
-
-corr_df = pd.DataFrame(corr_pairs)
-corr_df = corr_df.sort_values('Correlation', ascending=False)
-print("\nTop 5 Positive Correlations:")
-print(corr_df.head(5).to_string(index=False))
-print("\nTop 5 Negative Correlations:")
-print(corr_df.tail(5).to_string(index=False))
-
-print("\n" + "="*60)
-print("Analysis complete!")
-print("Generated files:")
-print("  - correlation_matrix.png (original)")
-print("  - normalized_correlation_matrix.png")
-print("  - factor_weights.png")
-print("="*60)
\ No newline at end of file
+if __name__ == "__main__":
+    main()